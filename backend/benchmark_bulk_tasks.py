@@ -0,0 +1,50 @@
+import asyncio
+
+import server
+from benchmark_common import BENCH_DB_NAME, clear, drop_bench_database, seed_events, seed_staff, time_call
+
+TASK_COUNTS = [10, 50, 100, 500]
+
+async def seed() -> tuple:
+    await clear("users", "institutions", "events", "tasks", "notifications")
+    admin, members = await seed_staff()
+    events = await seed_events(1, admin["id"], institution_count=1)
+    return admin, members, events[0]
+
+def build_tasks(count: int, members: list, event: dict) -> list:
+    return [
+        server.TaskCreate(
+            event_id=event["id"],
+            type=["photo", "video", "editing"][i % 3],
+            assigned_to=members[i % len(members)]["id"]
+        )
+        for i in range(count)
+    ]
+
+async def one_by_one(tasks: list, admin: dict):
+    for task in tasks:
+        await server.create_task(input=task, current_user=admin)
+    await server.notification_outbox.flush()
+
+async def bulk(tasks: list, admin: dict):
+    await server.create_tasks_bulk(input=server.TaskBulkCreate(tasks=tasks), current_user=admin)
+    await server.notification_outbox.flush()
+
+async def run_benchmark():
+    print(f"Benchmarking task creation against database '{BENCH_DB_NAME}'")
+    print("-" * 72)
+    print(f"{'tasks':>8} {'POST /tasks (tasks/s)':>24} {'POST /tasks/bulk (tasks/s)':>28} {'gain':>8}")
+    print("-" * 72)
+
+    admin, members, event = await seed()
+    for count in TASK_COUNTS:
+        tasks = build_tasks(count, members, event)
+        single_ms = await time_call(lambda: one_by_one(tasks, admin))
+        bulk_ms = await time_call(lambda: bulk(tasks, admin))
+        print(f"{count:>8} {count * 1000 / single_ms:>24.0f} {count * 1000 / bulk_ms:>28.0f} {single_ms / bulk_ms:>7.1f}x")
+
+    print("-" * 72)
+    await drop_bench_database()
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,78 @@
+import os
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import server
+
+# Benchmarks run against a scratch database so real data is never touched
+BENCH_DB_NAME = os.environ.get('BENCH_DB_NAME', f"{os.environ['DB_NAME']}_bench")
+RUNS_PER_COUNT = 5
+
+db = server.client[BENCH_DB_NAME]
+server.db = db
+
+async def clear(*names: str):
+    for name in names:
+        await db[name].delete_many({})
+
+async def seed_staff(member_count: int = 20) -> tuple:
+    """Insert an admin and member_count team members; returns (admin, members)"""
+    now = datetime.now(timezone.utc)
+    admin = {
+        "id": str(uuid.uuid4()),
+        "name": "Bench Admin",
+        "email": "bench-admin@media.com",
+        "role": "admin",
+        "created_at": now
+    }
+    members = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Member {i}",
+            "email": f"member{i}@media.com",
+            "role": "team_member",
+            "created_at": now
+        }
+        for i in range(member_count)
+    ]
+    await db.users.insert_many([admin] + members)
+    return admin, members
+
+async def seed_events(count: int, created_by: str, institution_count: int = 5) -> list:
+    """Insert institution_count institutions and count scheduled events spread over them"""
+    now = datetime.now(timezone.utc)
+    institutions = [
+        {"id": str(uuid.uuid4()), "name": f"Institution {i}", "is_active": True, "created_at": now}
+        for i in range(institution_count)
+    ]
+    await db.institutions.insert_many(institutions)
+
+    events = [
+        {
+            "id": str(uuid.uuid4()),
+            "title": f"Event {i}",
+            "institution_id": institutions[i % len(institutions)]["id"],
+            "event_date_start": now + timedelta(days=i % 60),
+            "status": "event_scheduled",
+            "priority": "normal",
+            "created_by": created_by,
+            "created_at": now
+        }
+        for i in range(count)
+    ]
+    await db.events.insert_many(events)
+    return events
+
+async def time_call(factory) -> float:
+    """Median wall time of RUNS_PER_COUNT awaits of factory(), in ms"""
+    timings = []
+    for _ in range(RUNS_PER_COUNT):
+        start = time.perf_counter()
+        await factory()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+async def drop_bench_database():
+    await server.client.drop_database(BENCH_DB_NAME)
@@ -0,0 +1,85 @@
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import server
+from benchmark_common import BENCH_DB_NAME, clear, db, drop_bench_database
+
+EQUIPMENT_COUNT = 200
+ALLOCATION_COUNTS = [1000, 5000, 10000]
+QUERIES = 200
+
+random.seed(42)
+
+async def seed(allocation_count: int) -> list:
+    await clear("equipment", "equipment_allocations")
+
+    now = datetime.now(timezone.utc)
+    equipment = [
+        {"id": str(uuid.uuid4()), "name": f"Item {i}", "status": "available", "created_at": now}
+        for i in range(EQUIPMENT_COUNT)
+    ]
+    await db.equipment.insert_many(equipment)
+
+    # Bookings spread over a year, a few hours to a few days each
+    allocations = []
+    for _ in range(allocation_count):
+        start = now + timedelta(hours=random.randint(0, 365 * 24))
+        allocations.append({
+            "id": str(uuid.uuid4()),
+            "event_id": str(uuid.uuid4()),
+            "equipment_id": random.choice(equipment)["id"],
+            "starts_at": start,
+            "ends_at": start + timedelta(hours=random.randint(2, 72)),
+            "created_at": now
+        })
+    await db.equipment_allocations.insert_many(allocations)
+    return allocations
+
+def windows() -> list:
+    now = datetime.now(timezone.utc)
+    result = []
+    for _ in range(QUERIES):
+        start = now + timedelta(hours=random.randint(0, 365 * 24))
+        result.append((start, start + timedelta(hours=random.randint(1, 48))))
+    return result
+
+def linear_busy(allocations: list, start: datetime, end: datetime) -> set:
+    """Check every allocation, as a scan without an interval index would"""
+    return {a["equipment_id"] for a in allocations if a["starts_at"] < end and a["ends_at"] > start}
+
+def per_query_ms(fn, queries: list) -> float:
+    start = time.perf_counter()
+    for window in queries:
+        fn(*window)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+async def run_benchmark():
+    print(f"Benchmarking equipment availability against database '{BENCH_DB_NAME}'")
+    print(f"{EQUIPMENT_COUNT} items, {QUERIES} random windows per row")
+    print("-" * 72)
+    print(f"{'allocations':>12} {'index build (ms)':>18} {'linear (ms/q)':>15} {'index (ms/q)':>14} {'speedup':>9}")
+    print("-" * 72)
+
+    for count in ALLOCATION_COUNTS:
+        allocations = await seed(count)
+        queries = windows()
+
+        server.allocation_index.invalidate()
+        start = time.perf_counter()
+        await server.allocation_index.ensure_loaded()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for window in queries:
+            assert server.allocation_index.busy(*window) == linear_busy(allocations, *window)
+        linear_ms = per_query_ms(lambda s, e: linear_busy(allocations, s, e), queries)
+        index_ms = per_query_ms(server.allocation_index.busy, queries)
+        print(f"{count:>12} {build_ms:>18.1f} {linear_ms:>15.3f} {index_ms:>14.3f} {linear_ms / index_ms:>8.1f}x")
+
+    print("-" * 72)
+    await drop_bench_database()
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
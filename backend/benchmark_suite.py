@@ -0,0 +1,227 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import httpx
+
+import server
+
+# Runs the app in-process, so latencies cover routing, auth, serialization
+# and Mongo round-trips but no network hop to the API.
+BENCH_DB_NAME = os.environ.get('BENCH_DB_NAME', f"{os.environ['DB_NAME']}_bench")
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+PASSWORD = "bench-password"
+SCENARIOS = ["login_storm", "task_list", "public_deliveries", "dashboard"]
+
+def connect(backend: str):
+    if backend == "memory":
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("The in-memory backend needs mongomock-motor: pip install mongomock-motor")
+        return AsyncMongoMockClient(tz_aware=True)
+    return server.AsyncIOMotorClient(os.environ['MONGO_URL'], tz_aware=True)
+
+async def seed(db, users: int, events: int, tasks: int) -> dict:
+    for name in ("users", "institutions", "events", "tasks", "public_deliveries", "notifications"):
+        await db[name].delete_many({})
+
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    # One hash for every account; bcrypt per user would dominate seeding
+    password_hash = server.hash_password(PASSWORD)
+    accounts = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Bench User {i}",
+            "email": f"bench{i}@media.com",
+            "password_hash": password_hash,
+            "role": "admin" if i == 0 else ("media_head" if i < 3 else "team_member"),
+            "token_version": 0,
+            "created_at": now
+        }
+        for i in range(max(users, 4))
+    ]
+    await db.users.insert_many(accounts)
+    members = [account for account in accounts if account["role"] == "team_member"]
+
+    institutions = [
+        {"id": str(uuid.uuid4()), "name": f"Institution {i}", "is_active": True, "created_at": now}
+        for i in range(10)
+    ]
+    await db.institutions.insert_many(institutions)
+
+    event_docs = [
+        {
+            "id": str(uuid.uuid4()),
+            "title": f"Event {i}",
+            "institution_id": rng.choice(institutions)["id"],
+            "event_date_start": now + timedelta(days=rng.randint(-180, 180)),
+            "status": rng.choice(["event_created", "event_scheduled", "shoot_completed", "closed"]),
+            "priority": rng.choice(["normal", "normal", "high", "vip"]),
+            "requirements": [],
+            "created_by": accounts[0]["id"],
+            "created_at": now,
+            "updated_at": now
+        }
+        for i in range(events)
+    ]
+    await db.events.insert_many(event_docs)
+
+    task_docs = []
+    for i in range(tasks):
+        status = rng.choice(["assigned", "in_progress", "completed"])
+        task_docs.append({
+            "id": str(uuid.uuid4()),
+            "event_id": rng.choice(event_docs)["id"],
+            "type": rng.choice(["photo", "video", "editing"]),
+            "assigned_to": rng.choice(members)["id"],
+            "due_date": now + timedelta(days=rng.randint(-30, 60)),
+            "status": status,
+            "deliverable_link": f"https://drive.example.com/{i}" if status == "completed" else None,
+            "created_at": now,
+            "updated_at": now
+        })
+    await db.tasks.insert_many(task_docs)
+    await server.rebuild_public_deliveries()
+    return {"admin": accounts[0], "members": members}
+
+def percentile(sorted_values: list, pct: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+async def run_scenario(request_factory, total: int, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await request_factory()
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "throughput": round(total / elapsed, 1),
+        "errors": errors
+    }
+
+async def login(http: httpx.AsyncClient, email: str) -> dict:
+    response = await http.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+async def run_suite(args) -> dict:
+    client = connect(args.backend)
+    server.client = client
+    server.db = client[BENCH_DB_NAME]
+    print(f"Seeding {args.users} users, {args.events} events, {args.tasks} tasks ({args.backend} backend)...")
+    accounts = await seed(server.db, args.users, args.events, args.tasks)
+
+    await server.app.router.startup()
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as http:
+            admin_headers = await login(http, accounts["admin"]["email"])
+            member_headers = [await login(http, member["email"]) for member in accounts["members"][:20]]
+            rng = random.Random(7)
+
+            factories = {
+                "login_storm": lambda: http.post(
+                    "/api/auth/login",
+                    json={"email": rng.choice(accounts["members"])["email"], "password": PASSWORD}
+                ),
+                "task_list": lambda: http.get(
+                    "/api/tasks", headers=admin_headers if rng.random() < 0.2 else rng.choice(member_headers)
+                ),
+                "public_deliveries": lambda: http.get("/api/deliveries/public", params={"limit": 100}),
+                "dashboard": lambda: http.get("/api/dashboard/stats", headers=admin_headers),
+            }
+            for name in args.scenarios:
+                # Logins are bcrypt-bound, so fewer of them keep runs short
+                total = max(args.requests // 5, args.concurrency) if name == "login_storm" else args.requests
+                results[name] = await run_scenario(factories[name], total, args.concurrency)
+    finally:
+        await server.app.router.shutdown()
+        if args.backend == "local":
+            await client.drop_database(BENCH_DB_NAME)
+    return results
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {current['p95_ms']} ms vs baseline {previous['p95_ms']} ms")
+        if current["throughput"] < previous["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['throughput']} req/s vs baseline {previous['throughput']} req/s")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process load test of the API with latency percentiles")
+    parser.add_argument("--backend", choices=["memory", "local"], default="memory",
+                        help="memory: mongomock-motor stand-in; local: the mongod at MONGO_URL")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing, 0.25 = 25%%")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_suite(args))
+
+    print("-" * 72)
+    print(f"{'scenario':<20} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10} {'req/s':>10} {'errors':>8}")
+    print("-" * 72)
+    for name, result in results.items():
+        print(f"{name:<20} {result['p50_ms']:>10.1f} {result['p95_ms']:>10.1f} {result['p99_ms']:>10.1f} "
+              f"{result['throughput']:>10.1f} {result['errors']:>8}")
+    print("-" * 72)
+
+    config = {key: getattr(args, key) for key in ("backend", "users", "events", "tasks", "requests", "concurrency")}
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({"config": config, "scenarios": results}, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if any(result["errors"] for result in results.values()):
+        print("FAILED: some requests returned errors")
+        return 1
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("config") != config:
+        print(f"Baseline was recorded with {baseline.get('config')}; comparing anyway")
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print("FAILED" if regressions else "No regressions against baseline")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
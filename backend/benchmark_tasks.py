@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+
+from fastapi import Response
+
+import server
+from benchmark_common import BENCH_DB_NAME, clear, db, drop_bench_database, seed_events, seed_staff, time_call
+
+TASK_COUNTS = [100, 250, 500, 1000]
+
+async def seed(task_count: int) -> dict:
+    await clear("users", "institutions", "events", "tasks")
+    admin, members = await seed_staff()
+    events = await seed_events(max(task_count // 4, 1), admin["id"])
+
+    now = datetime.now(timezone.utc)
+    tasks = [
+        {
+            "id": str(uuid.uuid4()),
+            "event_id": events[i % len(events)]["id"],
+            "type": ["photo", "video", "editing"][i % 3],
+            "assigned_to": members[i % len(members)]["id"],
+            "due_date": now + timedelta(days=i % 30),
+            "status": "assigned",
+            "created_at": now
+        }
+        for i in range(task_count)
+    ]
+    await db.tasks.insert_many(tasks)
+    return admin
+
+async def legacy_get_tasks() -> list:
+    """The previous per-row find_one enrichment, kept for comparison"""
+    tasks = await db.tasks.find({}, {"_id": 0}).sort("due_date", 1).to_list(1000)
+    for task in tasks:
+        event = await db.events.find_one({"id": task["event_id"]}, {"_id": 0})
+        if event:
+            task["event_title"] = event.get("title")
+            inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
+            task["institution_name"] = inst["name"] if inst else None
+        user = await db.users.find_one({"id": task["assigned_to"]}, {"_id": 0})
+        task["assigned_to_name"] = user["name"] if user else None
+    return tasks
+
+async def run_benchmark():
+    print(f"Benchmarking GET /api/tasks against database '{BENCH_DB_NAME}'")
+    print("-" * 60)
+    print(f"{'tasks':>8} {'legacy (ms)':>14} {'aggregate (ms)':>16} {'speedup':>10}")
+    print("-" * 60)
+
+    for count in TASK_COUNTS:
+        admin = await seed(count)
+        legacy_ms = await time_call(legacy_get_tasks)
+        aggregate_ms = await time_call(
+            lambda: server.get_tasks(
+                response=Response(), status=None, assigned_to=None, event_id=None,
+                limit=server.PAGE_SIZE_LIMIT, cursor=None, current_user=admin
+            )
+        )
+        print(f"{count:>8} {legacy_ms:>14.1f} {aggregate_ms:>16.1f} {legacy_ms / aggregate_ms:>9.1f}x")
+
+    print("-" * 60)
+    await drop_bench_database()
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import sys
+
+from server import client, db, import_csv, notification_outbox, IMPORT_BATCH_SIZE, IMPORT_KINDS, IMPORT_ROLES
+
+async def run_import(kind: str, path: str, email: str, batch_size: int) -> int:
+    try:
+        user = await db.users.find_one({"email": email}, {"_id": 0, "password_hash": 0})
+        if not user:
+            print(f"No user with email {email}")
+            return 1
+        if user["role"] not in IMPORT_ROLES:
+            print(f"{email} is a {user['role']}; imports need one of: {', '.join(IMPORT_ROLES)}")
+            return 1
+
+        # Same code path as POST /api/import/{kind}, reading the file line by line
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            report = await import_csv(kind, lines, user, batch_size)
+
+        for error in report.errors:
+            print(f"  line {error.row}: {error.error}")
+        print("=" * 60)
+        print(f"Imported {report.imported} of {report.total_rows} {kind} row(s), {len(report.errors)} error(s)")
+        print("=" * 60)
+        return 1 if report.errors else 0
+    finally:
+        # Notifications for imported tasks are still queued in the outbox
+        await notification_outbox.close()
+        client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import events or tasks from a CSV file")
+    parser.add_argument("kind", choices=IMPORT_KINDS)
+    parser.add_argument("path", help="CSV file with a header row")
+    parser.add_argument("--as", dest="email", required=True, help="email of the admin or media head recorded as creator")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run_import(args.kind, args.path, args.email, args.batch_size)))
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from pymongo import UpdateOne
+
+from server import client, db, DATE_FIELDS
+
+# Progress is checkpointed per collection so an interrupted run picks up
+# after the last converted batch instead of rescanning from the start.
+CHECKPOINTS = db.migrations
+MIGRATION_NAME = "bson_dates"
+
+def parse_date(value: str):
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+async def migrate_collection(name: str, fields: list, batch_size: int) -> int:
+    checkpoint_id = f"{MIGRATION_NAME}:{name}"
+    checkpoint = await CHECKPOINTS.find_one({"_id": checkpoint_id}) or {}
+    if checkpoint.get("done"):
+        print(f"  {name}: already migrated, skipping")
+        return 0
+
+    collection = db[name]
+    string_filter = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    converted = checkpoint.get("converted", 0)
+    last_id = checkpoint.get("last_id")
+
+    while True:
+        query = dict(string_filter)
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        docs = await collection.find(query, {field: 1 for field in fields}).sort("_id", 1).to_list(batch_size)
+        if not docs:
+            break
+
+        ops = []
+        for doc in docs:
+            update = {}
+            for field in fields:
+                if isinstance(doc.get(field), str):
+                    try:
+                        update[field] = parse_date(doc[field])
+                    except ValueError:
+                        print(f"  {name}: leaving unparseable {field}={doc[field]!r} on {doc['_id']}")
+            if update:
+                ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": update}))
+
+        if ops:
+            await collection.bulk_write(ops, ordered=False)
+        converted += len(ops)
+        last_id = docs[-1]["_id"]
+        await CHECKPOINTS.update_one(
+            {"_id": checkpoint_id},
+            {"$set": {"last_id": last_id, "converted": converted}},
+            upsert=True
+        )
+        print(f"  {name}: {converted} document(s) converted")
+
+    await CHECKPOINTS.update_one(
+        {"_id": checkpoint_id},
+        {"$set": {"done": True, "converted": converted, "finished_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+    return converted
+
+async def migrate(batch_size: int, restart: bool):
+    print("Converting ISO date strings to BSON dates...")
+    if restart:
+        await CHECKPOINTS.delete_many({"_id": {"$regex": f"^{MIGRATION_NAME}:"}})
+
+    total = 0
+    for name, fields in DATE_FIELDS.items():
+        total += await migrate_collection(name, fields, batch_size)
+
+    print("=" * 60)
+    print(f"Date migration completed: {total} document(s) converted")
+    print("=" * 60)
+    client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert stored ISO date strings to native BSON dates")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--restart", action="store_true", help="ignore checkpoints from a previous run")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch_size, args.restart))
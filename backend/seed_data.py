@@ -1,6 +1,8 @@
+import argparse
 import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 import bcrypt
+import random
 import uuid
 from datetime import datetime, timezone, timedelta
 import os
@@ -27,45 +29,48 @@ async def seed_database():
     await db.tasks.delete_many({})
     await db.equipment.delete_many({})
     await db.equipment_allocations.delete_many({})
+    # Emptied so the server rebuilds the read model from the seeded tasks on startup
+    await db.public_deliveries.delete_many({})
     print("Cleared existing data")
     
-    # Create users
+    # Create users; bcrypt is deliberately slow, so hash the shared password once
+    password_hash = hash_password("password123")
     users = [
         {
             "id": str(uuid.uuid4()),
             "name": "Admin User",
             "email": "admin@media.com",
-            "password_hash": hash_password("password123"),
+            "password_hash": password_hash,
             "role": "admin",
             "specialization": None,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Media Head",
             "email": "head@media.com",
-            "password_hash": hash_password("password123"),
+            "password_hash": password_hash,
             "role": "media_head",
             "specialization": None,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
             "name": "John Photographer",
             "email": "member@media.com",
-            "password_hash": hash_password("password123"),
+            "password_hash": password_hash,
             "role": "team_member",
             "specialization": "photo",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
             "name": "Sarah Videographer",
             "email": "sarah@media.com",
-            "password_hash": hash_password("password123"),
+            "password_hash": password_hash,
             "role": "team_member",
             "specialization": "video",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
     ]
     await db.users.insert_many(users)
@@ -79,7 +84,7 @@ async def seed_database():
             "short_code": "SMVEC",
             "type": "college",
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -87,7 +92,7 @@ async def seed_database():
             "short_code": "SMVNC",
             "type": "college",
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         },
         {
             "id": str(uuid.uuid4()),
@@ -95,7 +100,7 @@ async def seed_database():
             "short_code": "TKS",
             "type": "university",
             "is_active": True,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
     ]
     await db.institutions.insert_many(institutions)
@@ -111,7 +116,7 @@ async def seed_database():
             "title": "Annual Graduation Ceremony 2024",
             "institution_id": institutions[0]["id"],
             "department": "All Departments",
-            "event_date_start": (now + timedelta(days=15)).isoformat(),
+            "event_date_start": now + timedelta(days=15),
             "event_date_end": None,
             "venue": "Main Auditorium",
             "description": "Annual graduation ceremony for batch 2020-2024",
@@ -121,18 +126,18 @@ async def seed_database():
             "requirements": ["photos", "video_coverage", "highlight_video"],
             "comments": "High priority event, need professional coverage",
             "priority": "vip",
-            "deliverable_due_date": (now + timedelta(days=20)).isoformat(),
+            "deliverable_due_date": now + timedelta(days=20),
             "status": "event_scheduled",
             "created_by": admin_id,
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
             "title": "Tech Symposium 2024",
             "institution_id": institutions[0]["id"],
             "department": "Computer Science",
-            "event_date_start": (now + timedelta(days=5)).isoformat(),
-            "event_date_end": (now + timedelta(days=7)).isoformat(),
+            "event_date_start": now + timedelta(days=5),
+            "event_date_end": now + timedelta(days=7),
             "venue": "IT Block Seminar Hall",
             "description": "Three-day technical symposium with workshops and competitions",
             "event_type": "workshop",
@@ -141,17 +146,17 @@ async def seed_database():
             "requirements": ["photos", "video_coverage", "instagram_reel"],
             "comments": "Need social media content",
             "priority": "high",
-            "deliverable_due_date": (now + timedelta(days=10)).isoformat(),
+            "deliverable_due_date": now + timedelta(days=10),
             "status": "event_scheduled",
             "created_by": admin_id,
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
             "title": "Sports Day 2024",
             "institution_id": institutions[1]["id"],
             "department": "Physical Education",
-            "event_date_start": (now - timedelta(days=10)).isoformat(),
+            "event_date_start": now - timedelta(days=10),
             "event_date_end": None,
             "venue": "Main Ground",
             "description": "Annual sports competition",
@@ -161,10 +166,10 @@ async def seed_database():
             "requirements": ["photos", "video_coverage"],
             "comments": "Fast-paced event, need action shots",
             "priority": "normal",
-            "deliverable_due_date": (now - timedelta(days=5)).isoformat(),
+            "deliverable_due_date": now - timedelta(days=5),
             "status": "closed",
             "created_by": admin_id,
-            "created_at": (now - timedelta(days=15)).isoformat()
+            "created_at": now - timedelta(days=15)
         }
     ]
     await db.events.insert_many(events)
@@ -180,55 +185,55 @@ async def seed_database():
             "event_id": events[0]["id"],
             "type": "photo",
             "assigned_to": team_member["id"],
-            "due_date": (now + timedelta(days=15)).isoformat(),
+            "due_date": now + timedelta(days=15),
             "status": "assigned",
             "deliverable_link": None,
             "comments": None,
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
             "event_id": events[0]["id"],
             "type": "video",
             "assigned_to": videographer["id"],
-            "due_date": (now + timedelta(days=15)).isoformat(),
+            "due_date": now + timedelta(days=15),
             "status": "assigned",
             "deliverable_link": None,
             "comments": "Need full ceremony coverage",
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
             "event_id": events[1]["id"],
             "type": "photo",
             "assigned_to": team_member["id"],
-            "due_date": (now + timedelta(days=7)).isoformat(),
+            "due_date": now + timedelta(days=7),
             "status": "in_progress",
             "deliverable_link": None,
             "comments": "Working on it",
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
             "event_id": events[2]["id"],
             "type": "photo",
             "assigned_to": team_member["id"],
-            "due_date": (now - timedelta(days=5)).isoformat(),
+            "due_date": now - timedelta(days=5),
             "status": "completed",
             "deliverable_link": "https://drive.google.com/sample-sports-day-photos",
             "comments": "Delivered all photos",
-            "created_at": (now - timedelta(days=10)).isoformat()
+            "created_at": now - timedelta(days=10)
         },
         {
             "id": str(uuid.uuid4()),
             "event_id": events[2]["id"],
             "type": "video",
             "assigned_to": videographer["id"],
-            "due_date": (now - timedelta(days=5)).isoformat(),
+            "due_date": now - timedelta(days=5),
             "status": "completed",
             "deliverable_link": "https://drive.google.com/sample-sports-day-video",
             "comments": "Highlight video ready",
-            "created_at": (now - timedelta(days=10)).isoformat()
+            "created_at": now - timedelta(days=10)
         }
     ]
     await db.tasks.insert_many(tasks)
@@ -242,7 +247,7 @@ async def seed_database():
             "code": "CAM001",
             "status": "available",
             "notes": "4K video camera with gimbal",
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
@@ -250,7 +255,7 @@ async def seed_database():
             "code": "CAM002",
             "status": "available",
             "notes": "High-resolution photography camera",
-            "created_at": now.isoformat()
+            "created_at": now
         },
         {
             "id": str(uuid.uuid4()),
@@ -258,7 +263,7 @@ async def seed_database():
             "code": "DRONE001",
             "status": "available",
             "notes": "Aerial photography drone",
-            "created_at": now.isoformat()
+            "created_at": now
         }
     ]
     await db.equipment.insert_many(equipment)
@@ -275,5 +280,218 @@ async def seed_database():
     print("Videographer: sarah@media.com / password123")
     print("-" * 60)
 
+# Generated data is a pure function of the seed and the anchor date, so two
+# runs with the same arguments produce identical ids, dates and assignments.
+# Tasks are built lazily, batch by batch, so memory stays flat at 1M tasks.
+DEPARTMENTS = [
+    "Computer Science", "Mechanical", "Civil", "Electronics", "Nursing",
+    "Management", "Physical Education", "Fine Arts", "All Departments"
+]
+VENUES = ["Main Auditorium", "Seminar Hall", "Main Ground", "Conference Room", "Open Air Theatre", "Library Hall"]
+EVENT_TYPES = {
+    "cultural": 18, "seminar": 25, "workshop": 22, "sports": 10,
+    "inauguration": 8, "convocation": 3, "press_meet": 4, "other": 10
+}
+PRIORITIES = {"normal": 70, "high": 22, "vip": 8}
+REQUIREMENTS = {
+    "photos": 0.95, "video_coverage": 0.6, "highlight_video": 0.3,
+    "instagram_reel": 0.35, "live_stream": 0.1, "drone": 0.05
+}
+TASK_TYPES = {"photo": 45, "video": 30, "editing": 20, "other": 5}
+# VIP events draw more crew than routine ones
+TASK_WEIGHT_BY_PRIORITY = {"normal": 1, "high": 2, "vip": 4}
+
+def weighted(rng: random.Random, weights: dict) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+def seeded_id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def generate_users(rng: random.Random, count: int, password_hash: str, created_at: datetime) -> list:
+    staff = [
+        ("Admin User", "admin@media.com", "admin", None),
+        ("Media Head", "head@media.com", "media_head", None)
+    ]
+    specializations = list(TASK_TYPES)
+    for i in range(count):
+        specialization = specializations[i % len(specializations)]
+        staff.append((f"Team Member {i + 1}", f"member{i + 1:04d}@media.com", "team_member", specialization))
+    return [
+        {
+            "id": seeded_id(rng),
+            "name": name,
+            "email": email,
+            "password_hash": password_hash,
+            "role": role,
+            "specialization": specialization,
+            "created_at": created_at
+        }
+        for name, email, role, specialization in staff
+    ]
+
+def generate_institutions(rng: random.Random, count: int, created_at: datetime) -> list:
+    types = ["college", "college", "school", "university", "hospital"]
+    return [
+        {
+            "id": seeded_id(rng),
+            "name": f"SMV Institution {i + 1}",
+            "short_code": f"SMV{i + 1:02d}",
+            "type": types[i % len(types)],
+            "is_active": True,
+            "created_at": created_at
+        }
+        for i in range(count)
+    ]
+
+def event_status(rng: random.Random, days_from_anchor: float) -> str:
+    if days_from_anchor > 0:
+        return rng.choices(["event_created", "event_scheduled"], weights=[35, 65])[0]
+    if days_from_anchor > -30:
+        return rng.choices(["shoot_completed", "delivery_in_progress", "closed"], weights=[30, 45, 25])[0]
+    return rng.choices(["delivery_in_progress", "closed"], weights=[5, 95])[0]
+
+def generate_events(rng: random.Random, count: int, anchor: datetime, institutions: list, admin_id: str):
+    # A few large institutions host most events (Zipf-like)
+    institution_weights = [1 / (rank + 1) for rank in range(len(institutions))]
+    for i in range(count):
+        # Two years of history, most of it recent, plus one term of upcoming events
+        days = rng.triangular(-730, 120, 0)
+        start = (anchor + timedelta(days=days)).replace(hour=rng.randint(8, 17), minute=rng.choice([0, 30]))
+        end = start + timedelta(days=rng.randint(1, 3)) if rng.random() < 0.2 else None
+        requirements = [name for name, share in REQUIREMENTS.items() if rng.random() < share] or ["photos"]
+        event_type = weighted(rng, EVENT_TYPES)
+        created_at = min(start, anchor) - timedelta(days=rng.randint(3, 45))
+        yield {
+            "id": seeded_id(rng),
+            "title": f"{event_type.replace('_', ' ').title()} {i + 1}",
+            "institution_id": rng.choices(institutions, weights=institution_weights)[0]["id"],
+            "department": rng.choice(DEPARTMENTS),
+            "event_date_start": start,
+            "event_date_end": end,
+            "venue": rng.choice(VENUES),
+            "description": None,
+            "event_type": event_type,
+            "expected_audience": rng.choice([50, 100, 200, 300, 500, 1000]),
+            "chief_guests": None,
+            "requirements": requirements,
+            "comments": None,
+            "priority": weighted(rng, PRIORITIES),
+            "deliverable_due_date": (end or start) + timedelta(days=rng.randint(3, 10)),
+            "status": event_status(rng, days),
+            "created_by": admin_id,
+            "created_at": created_at,
+            "updated_at": created_at
+        }
+
+def task_status(rng: random.Random, event: dict) -> str:
+    if event["status"] == "closed":
+        return "completed"
+    if event["status"] in ("event_created", "event_scheduled"):
+        return rng.choices(["assigned", "in_progress"], weights=[85, 15])[0]
+    return rng.choices(["assigned", "in_progress", "completed"], weights=[10, 35, 55])[0]
+
+def generate_tasks(rng: random.Random, count: int, events: list, members: list, batch_size: int):
+    members_by_type = {task_type: [m for m in members if m["specialization"] == task_type] or members
+                       for task_type in TASK_TYPES}
+    cum_weights = []
+    total = 0
+    for event in events:
+        total += TASK_WEIGHT_BY_PRIORITY[event["priority"]]
+        cum_weights.append(total)
+
+    made = 0
+    while made < count:
+        size = min(batch_size, count - made)
+        batch = []
+        for event in rng.choices(events, cum_weights=cum_weights, k=size):
+            task_type = weighted(rng, TASK_TYPES)
+            status = task_status(rng, event)
+            created_at = event["created_at"] + timedelta(hours=rng.randint(1, 48))
+            batch.append({
+                "id": seeded_id(rng),
+                "event_id": event["id"],
+                "type": task_type,
+                "assigned_to": rng.choice(members_by_type[task_type])["id"],
+                "due_date": event["deliverable_due_date"],
+                "status": status,
+                "deliverable_link": f"https://drive.google.com/delivery-{made + len(batch)}" if status == "completed" else None,
+                "comments": None,
+                "created_at": created_at,
+                "updated_at": created_at
+            })
+        made += size
+        yield batch
+
+def batched(docs, batch_size: int):
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+async def insert_batches(collection, batches, workers: int) -> int:
+    """insert_many each batch, keeping up to `workers` inserts in flight"""
+    pending = set()
+    inserted = 0
+    for number, batch in enumerate(batches, 1):
+        if len(pending) >= workers:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        pending.add(asyncio.create_task(collection.insert_many(batch, ordered=False)))
+        inserted += len(batch)
+        if number % 20 == 0:
+            print(f"  {collection.name}: {inserted}")
+    await asyncio.gather(*pending)
+    return inserted
+
+async def generate_database(events: int, tasks: int, users: int, institutions: int,
+                            seed: int, anchor: datetime, batch_size: int, workers: int):
+    print(f"Generating {events} events and {tasks} tasks (seed {seed}, anchor {anchor.date()})...")
+    for name in ("users", "institutions", "events", "tasks", "equipment", "equipment_allocations",
+                 "public_deliveries", "notifications", "tombstones"):
+        await db[name].delete_many({})
+    print("Cleared existing data")
+
+    rng = random.Random(seed)
+    password_hash = hash_password("password123")
+    user_docs = generate_users(rng, users, password_hash, anchor - timedelta(days=800))
+    await db.users.insert_many(user_docs)
+    institution_docs = generate_institutions(rng, institutions, anchor - timedelta(days=800))
+    await db.institutions.insert_many(institution_docs)
+    print(f"Created {len(user_docs)} users and {len(institution_docs)} institutions")
+
+    # Tasks need the event dates and priorities, so events are kept in memory
+    event_docs = list(generate_events(rng, events, anchor, institution_docs, user_docs[0]["id"]))
+    await insert_batches(db.events, batched(event_docs, batch_size), workers)
+    print(f"Created {len(event_docs)} events")
+
+    members = [user for user in user_docs if user["role"] == "team_member"]
+    created = await insert_batches(db.tasks, generate_tasks(rng, tasks, event_docs, members, batch_size), workers)
+    print(f"Created {created} tasks")
+    print("Indexes and the public deliveries read model are built when the server next starts")
+
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    parser = argparse.ArgumentParser(description="Seed demo data, or generate a large synthetic dataset")
+    parser.add_argument("--generate", action="store_true", help="generate synthetic data instead of the demo set")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=200, help="generated team members")
+    parser.add_argument("--institutions", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", type=datetime.fromisoformat, default=None,
+                        help="date the generated timeline is centred on, YYYY-MM-DD (default: today)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4, help="insert_many batches in flight")
+    args = parser.parse_args()
+
+    if args.generate:
+        anchor = args.anchor or datetime.now(timezone.utc)
+        anchor = anchor.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
+        asyncio.run(generate_database(args.events, args.tasks, args.users, args.institutions,
+                                      args.seed, anchor, args.batch_size, args.workers))
+    else:
+        asyncio.run(seed_database())
@@ -1,14 +1,34 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, File, Query, Request, Response, UploadFile, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne, ReturnDocument, UpdateOne, monitoring
+from pymongo.errors import BulkWriteError, CollectionInvalid, OperationFailure
+from bson import json_util
 import os
+import json
+import asyncio
+import contextvars
+import csv
+import hashlib
+import hmac
+import io
 import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter, ValidationError
 from typing import List, Optional
 import uuid
+import base64
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 import bcrypt
 from jose import jwt
@@ -16,18 +36,98 @@ from jose import jwt
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# Mongo round-trips made while serving a request. The metrics middleware
+# puts a QueryStats in current_query_stats; Motor copies the context into
+# the threads that run commands, so the listener below finds it there.
+current_query_stats = contextvars.ContextVar("current_query_stats", default=None)
+
+class QueryStats:
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.queries = 0
+        self.documents = 0
+        self.seconds = 0.0
+        self.commands = {}
+        self.lock = threading.Lock()
+
+    def record(self, command: str, seconds: float, documents: int):
+        with self.lock:
+            self.queries += 1
+            self.documents += documents
+            self.seconds += seconds
+            self.commands[command] = self.commands.get(command, 0) + 1
+
+    @property
+    def route(self) -> str:
+        if self.scope is None:
+            return "background"
+        # FastAPI records the matched route, so paths group by template
+        route = self.scope.get("route")
+        return route.path if route else "unmatched"
+
+# Commands issued outside a request (outbox worker, refresh loops, startup)
+background_query_stats = QueryStats()
+
+class QueryStatsListener(monitoring.CommandListener):
+    def started(self, event):
+        if slow_query_log.enabled:
+            slow_query_log.started(event, (current_query_stats.get() or background_query_stats).route)
+
+    def succeeded(self, event):
+        cursor = event.reply.get("cursor") if isinstance(event.reply, dict) else None
+        documents = len(cursor.get("firstBatch", cursor.get("nextBatch", []))) if cursor else 0
+        stats = current_query_stats.get() or background_query_stats
+        stats.record(event.command_name, event.duration_micros / 1e6, documents)
+        if slow_query_log.enabled:
+            slow_query_log.finished(event)
+
+    def failed(self, event):
+        stats = current_query_stats.get() or background_query_stats
+        stats.record(event.command_name, event.duration_micros / 1e6, 0)
+        if slow_query_log.enabled:
+            slow_query_log.finished(event)
+
+# MongoDB connection. Dates are stored as native BSON datetimes and read back
+# as timezone-aware UTC datetimes, so handlers never parse date strings.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True, event_listeners=[QueryStatsListener()])
 db = client[os.environ['DB_NAME']]
 
+# Date fields per collection. Documents written before dates were stored
+# natively hold ISO strings here; migrate_dates.py converts them.
+DATE_FIELDS = {
+    "users": ["created_at"],
+    "institutions": ["created_at"],
+    "events": ["created_at", "event_date_start", "event_date_end", "deliverable_due_date"],
+    "tasks": ["created_at", "due_date"],
+    "equipment": ["created_at"],
+    "equipment_allocations": ["created_at"],
+    "notifications": ["created_at"],
+    "public_deliveries": ["event_date", "completed_at"],
+}
+
 # JWT Secret
 JWT_SECRET = os.environ.get('JWT_SECRET', 'media-hub-secret-key-change-in-production')
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_HOURS = 24
 
+# Auth mode: "stateless" authorizes from the signed token claims and only
+# checks the user's token version against an in-memory cache; "lookup" loads
+# the user document on every request.
+AUTH_MODE = os.environ.get('AUTH_MODE', 'stateless')
+TOKEN_VERSION_REFRESH_SECONDS = int(os.environ.get('TOKEN_VERSION_REFRESH_SECONDS', '30'))
+
+# Cache of user documents in front of the lookup auth path
+USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', '1024'))
+USER_CACHE_TTL_SECONDS = float(os.environ.get('USER_CACHE_TTL_SECONDS', '60'))
+
+# Maximum number of bcrypt hashes/verifications running at once
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', str(min(4, os.cpu_count() or 1))))
+
 # Security
 security = HTTPBearer()
+# EventSource cannot send headers, so streams also accept ?token=
+optional_security = HTTPBearer(auto_error=False)
 
 # Create the main app without a prefix
 app = FastAPI()
@@ -119,6 +219,7 @@ class Event(EventBase):
     id: str
     created_by: str
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 class EventResponse(Event):
     institution_name: Optional[str] = None
@@ -139,6 +240,7 @@ class Task(TaskBase):
     model_config = ConfigDict(extra="ignore")
     id: str
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 class TaskResponse(Task):
     event_title: Optional[str] = None
@@ -146,6 +248,30 @@ class TaskResponse(Task):
     institution_name: Optional[str] = None
     assigned_to_name: Optional[str] = None
 
+class TaskBulkCreate(BaseModel):
+    tasks: List[TaskCreate]
+    mode: str = "atomic"  # atomic, ordered
+
+class TaskBulkResult(BaseModel):
+    index: int
+    status: str  # created, error, skipped
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+class TaskBulkResponse(BaseModel):
+    created: int
+    results: List[TaskBulkResult]
+
+class ImportRowError(BaseModel):
+    row: int  # line number in the file, the header being line 1
+    error: str
+
+class ImportReport(BaseModel):
+    kind: str
+    total_rows: int
+    imported: int
+    errors: List[ImportRowError]
+
 class ManualDeliverableCreate(BaseModel):
     deliverable_link: str
     type: str = "other"  # photo, video, editing, other
@@ -164,6 +290,7 @@ class Equipment(EquipmentBase):
     model_config = ConfigDict(extra="ignore")
     id: str
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 class EquipmentAllocationBase(BaseModel):
     event_id: str
@@ -177,7 +304,10 @@ class EquipmentAllocation(EquipmentAllocationBase):
     model_config = ConfigDict(extra="ignore")
     id: str
     allocated_by: str
+    starts_at: Optional[datetime] = None  # booking window, copied from the event
+    ends_at: Optional[datetime] = None
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 class EquipmentAllocationResponse(EquipmentAllocation):
     equipment_name: Optional[str] = None
@@ -211,6 +341,15 @@ class Notification(NotificationBase):
     id: str
     created_at: datetime
 
+class SyncResponse(BaseModel):
+    events: List[Event]
+    tasks: List[Task]
+    equipment: List[Equipment]
+    equipment_allocations: List[EquipmentAllocation]
+    deleted: dict  # collection name -> ids deleted since the token
+    next_token: str
+    has_more: bool = False
+
 class DashboardStats(BaseModel):
     upcoming_events: int
     pending_deliveries: int
@@ -219,6 +358,20 @@ class DashboardStats(BaseModel):
     total_events: int
     total_tasks: int
 
+class CalendarEvent(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    title: str
+    institution_id: str
+    institution_name: Optional[str] = None
+    event_date_start: datetime
+    event_date_end: Optional[datetime] = None
+    venue: Optional[str] = None
+    event_type: Optional[str] = None
+    requirements: List[str] = []
+    priority: str = "normal"
+    status: str = "event_created"
+
 class PublicEvent(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str
@@ -242,9 +395,65 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
-def create_access_token(user_id: str, email: str, role: str) -> str:
+class PasswordWorkerPool:
+    """Runs bcrypt off the event loop on a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    without the pickling overhead of a process pool. Jobs beyond the worker
+    count wait on a semaphore, which is where the queueing metrics come from.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.semaphore = asyncio.Semaphore(workers)
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def run(self, fn, *args):
+        queued_at = time.monotonic()
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        
+        wait = time.monotonic() - queued_at
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "waiting": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "avg_wait_ms": self.total_wait_seconds / self.completed * 1000 if self.completed else 0.0,
+            "max_wait_ms": self.max_wait_seconds * 1000
+        }
+
+password_pool = PasswordWorkerPool(PASSWORD_HASH_WORKERS)
+
+def create_access_token(user: dict) -> str:
     expire = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
-    to_encode = {"sub": user_id, "email": email, "role": role, "exp": expire}
+    to_encode = {
+        "sub": user["id"],
+        "email": user["email"],
+        "name": user["name"],
+        "role": user["role"],
+        "ver": user.get("token_version", 0),
+        "exp": expire
+    }
     return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 def decode_access_token(token: str) -> dict:
@@ -256,12 +465,127 @@ def decode_access_token(token: str) -> dict:
     except jwt.JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
+class TokenVersionCache:
+    """Per-process map of user id to token version used to revoke stateless tokens.
+
+    The whole map is reloaded every TOKEN_VERSION_REFRESH_SECONDS, so a token
+    revoked by another worker stops working within one refresh interval.
+    Writes made by this process update the map immediately.
+    """
+
+    def __init__(self):
+        self.versions = {}
+        self.task = None
+
+    async def refresh(self):
+        users = await db.users.find({}, {"_id": 0, "id": 1, "token_version": 1}).to_list(None)
+        # Versions only grow, so keep a bump made while this snapshot was read;
+        # users missing from the snapshot have been deleted and drop out
+        self.versions = {
+            user["id"]: max(user.get("token_version", 0), self.versions.get(user["id"], 0))
+            for user in users
+        }
+
+    async def get(self, user_id: str) -> Optional[int]:
+        if user_id not in self.versions:
+            # Users created since the last refresh, possibly on another worker
+            user = await db.users.find_one({"id": user_id}, {"_id": 0, "id": 1, "token_version": 1})
+            if not user:
+                return None
+            self.set(user_id, user.get("token_version", 0))
+        return self.versions[user_id]
+
+    def set(self, user_id: str, version: int):
+        self.versions[user_id] = max(version, self.versions.get(user_id, 0))
+
+    def discard(self, user_id: str):
+        self.versions.pop(user_id, None)
+
+    async def run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Token version refresh failed: {e}")
+            await asyncio.sleep(TOKEN_VERSION_REFRESH_SECONDS)
+
+token_versions = TokenVersionCache()
+
+class UserCache:
+    """Bounded LRU cache of user documents whose entries expire after a TTL.
+
+    Writes to a user evict it here; other workers only see the change once
+    their entry expires, so the TTL bounds how stale a cached role can be.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Optional[dict]:
+        entry = self.entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self.entries[user_id]
+            self.misses += 1
+            return None
+        self.entries.move_to_end(user_id)
+        self.hits += 1
+        return dict(entry[1])
+
+    def put(self, user_id: str, user: dict):
+        self.entries[user_id] = (time.monotonic() + self.ttl_seconds, user)
+        self.entries.move_to_end(user_id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def evict(self, user_id: str):
+        self.entries.pop(user_id, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+user_cache = UserCache(USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS)
+
+async def bump_token_version(user_id: str):
+    """Invalidate every token issued to the user so far"""
+    await db.users.update_one({"id": user_id}, {"$inc": {"token_version": 1}})
+    user = await db.users.find_one({"id": user_id}, {"_id": 0, "id": 1, "token_version": 1})
+    if user:
+        token_versions.set(user_id, user["token_version"])
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     token = credentials.credentials
     payload = decode_access_token(token)
-    user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0})
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    
+    # Tokens issued before claims were embedded fall back to the lookup path
+    if AUTH_MODE == "stateless" and "ver" in payload:
+        version = await token_versions.get(payload["sub"])
+        if version is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        if version != payload["ver"]:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
+        return {"id": payload["sub"], "email": payload["email"], "name": payload["name"], "role": payload["role"]}
+    
+    user = user_cache.get(payload["sub"])
+    if user is None:
+        user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0, "password_hash": 0})
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        user_cache.put(payload["sub"], user)
+    if "ver" in payload and user.get("token_version", 0) != payload["ver"]:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
     return user
 
 def require_role(required_roles: List[str]):
@@ -271,6 +595,122 @@ def require_role(required_roles: List[str]):
         return current_user
     return role_checker
 
+@app.on_event("startup")
+async def start_token_version_refresh():
+    if AUTH_MODE == "stateless":
+        token_versions.task = asyncio.create_task(token_versions.run())
+
+@app.on_event("shutdown")
+async def stop_token_version_refresh():
+    if token_versions.task:
+        token_versions.task.cancel()
+
+@app.on_event("shutdown")
+async def stop_password_pool():
+    password_pool.executor.shutdown(wait=False)
+
+# ============================================================================
+# BATCH RESOLVER
+# ============================================================================
+
+async def fetch_by_ids(collection, ids, fields: List[str]) -> dict:
+    """Fetch documents whose id is in ids with one $in query, keyed by id"""
+    unique_ids = list({i for i in ids if i})
+    if not unique_ids:
+        return {}
+    projection = {"_id": 0, "id": 1, **{field: 1 for field in fields}}
+    docs = await collection.find({"id": {"$in": unique_ids}}, projection).to_list(None)
+    return {doc["id"]: doc for doc in docs}
+
+async def attach_related(
+    items: List[dict],
+    local_field: str,
+    collection,
+    target_field: str,
+    source_field: str = "name"
+) -> List[dict]:
+    """Copy source_field from the document referenced by item[local_field] onto each item.
+
+    Issues a single query for the whole list, so enriching N rows costs one
+    round-trip per referenced collection instead of one per row.
+    """
+    related = await fetch_by_ids(collection, (item.get(local_field) for item in items), [source_field])
+    for item in items:
+        doc = related.get(item.get(local_field))
+        item[target_field] = doc.get(source_field) if doc else None
+    return items
+
+# ============================================================================
+# PAGINATION
+# ============================================================================
+
+# List endpoints use keyset pagination: rows are sorted on (sort field, id)
+# and an opaque cursor holds both values of the last row returned. The next
+# page's cursor is sent in the X-Next-Cursor response header, so the body
+# stays a plain list.
+PAGE_SIZE_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+CURSOR_JSON_OPTIONS = json_util.JSONOptions(tz_aware=True)
+
+def encode_cursor(row: dict, sort_field: str) -> str:
+    raw = json_util.dumps([row.get(sort_field), row["id"]])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        value, row_id = json_util.loads(base64.urlsafe_b64decode(cursor.encode('ascii')), json_options=CURSOR_JSON_OPTIONS)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Every list is keyed on a date, and anything else (say a {"$ne": ...}
+    # document) would be read as a query operator by keyset_query
+    if not isinstance(row_id, str) or not (value is None or isinstance(value, datetime)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value, row_id
+
+def keyset_query(query: dict, cursor: Optional[str], sort_field: str, direction: int) -> dict:
+    """Restrict query to the rows that sort after the cursor"""
+    if not cursor:
+        return query
+    
+    value, row_id = decode_cursor(cursor)
+    beyond = "$gt" if direction == 1 else "$lt"
+    # MongoDB sorts null before any date, so nulls open an ascending list and
+    # close a descending one
+    if value is None:
+        after = [{sort_field: None, "id": {beyond: row_id}}]
+        if direction == 1:
+            after.append({sort_field: {"$ne": None}})
+    else:
+        after = [{sort_field: {beyond: value}}, {sort_field: value, "id": {beyond: row_id}}]
+        if direction == -1:
+            after.append({sort_field: None})
+    return {"$and": [query, {"$or": after}]} if query else {"$or": after}
+
+def keyset_sort(sort_field: str, direction: int) -> list:
+    return [(sort_field, direction), ("id", direction)]
+
+def finish_page(rows: List[dict], limit: int, sort_field: str, response: Response) -> List[dict]:
+    """Trim the look-ahead row and advertise the next cursor if there is one"""
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1], sort_field)
+    return rows
+
+async def find_page(
+    collection,
+    query: dict,
+    projection: dict,
+    sort_field: str,
+    direction: int,
+    limit: int,
+    cursor: Optional[str],
+    response: Response
+) -> List[dict]:
+    rows = await collection.find(
+        keyset_query(query, cursor, sort_field, direction), projection
+    ).sort(keyset_sort(sort_field, direction)).to_list(limit + 1)
+    return finish_page(rows, limit, sort_field, response)
+
 # ============================================================================
 # AUTH ROUTES
 # ============================================================================
@@ -283,13 +723,14 @@ async def register(input: UserCreate):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Hash password
-    hashed_pw = hash_password(input.password)
+    hashed_pw = await password_pool.run(hash_password, input.password)
     
     # Create user
     user_dict = input.model_dump(exclude={"password"})
     user_dict["id"] = str(uuid.uuid4())
-    user_dict["created_at"] = datetime.now(timezone.utc).isoformat()
+    user_dict["created_at"] = datetime.now(timezone.utc)
     user_dict["password_hash"] = hashed_pw
+    user_dict["token_version"] = 0
     
     await db.users.insert_one(user_dict)
     
@@ -301,17 +742,21 @@ async def login(input: LoginRequest):
     if not user:
         raise HTTPException(status_code=400, detail="Invalid email or password")
     
-    if not verify_password(input.password, user["password_hash"]):
+    if not await password_pool.run(verify_password, input.password, user["password_hash"]):
         raise HTTPException(status_code=400, detail="Invalid email or password")
     
-    token = create_access_token(user["id"], user["email"], user["role"])
+    token = create_access_token(user)
     
     user_response = UserResponse(**{k: v for k, v in user.items() if k != "password_hash"})
     return LoginResponse(token=token, user=user_response)
 
 @api_router.get("/auth/me", response_model=UserResponse)
 async def get_me(current_user: dict = Depends(get_current_user)):
-    return UserResponse(**current_user)
+    # The stateless principal only carries token claims, so load the profile
+    user = await db.users.find_one({"id": current_user["id"]}, {"_id": 0, "password_hash": 0})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return UserResponse(**user)
 
 @api_router.post("/auth/change-password")
 async def change_password(input: ChangePasswordRequest, current_user: dict = Depends(get_current_user)):
@@ -319,24 +764,32 @@ async def change_password(input: ChangePasswordRequest, current_user: dict = Dep
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if not verify_password(input.old_password, user["password_hash"]):
+    if not await password_pool.run(verify_password, input.old_password, user["password_hash"]):
         raise HTTPException(status_code=400, detail="Old password is incorrect")
 
-    new_hash = hash_password(input.new_password)
+    new_hash = await password_pool.run(hash_password, input.new_password)
     await db.users.update_one({"id": current_user["id"]}, {"$set": {"password_hash": new_hash}})
-    return {"message": "Password updated successfully"}
+    
+    # Sign out every other session and hand the caller a fresh token
+    await bump_token_version(current_user["id"])
+    user_cache.evict(current_user["id"])
+    user = await db.users.find_one({"id": current_user["id"]}, {"_id": 0})
+    return {"message": "Password updated successfully", "token": create_access_token(user)}
 
 # ============================================================================
 # USER ROUTES
 # ============================================================================
 
 @api_router.get("/users", response_model=List[UserResponse])
-async def get_users(current_user: dict = Depends(require_role(["admin"]))):
-    users = await db.users.find({}, {"_id": 0, "password_hash": 0}).to_list(1000)
-    for user in users:
-        if isinstance(user.get('created_at'), str):
-            user['created_at'] = datetime.fromisoformat(user['created_at'])
-    return users
+async def get_users(
+    response: Response,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(require_role(["admin"]))
+):
+    return await find_page(
+        db.users, {}, {"_id": 0, "password_hash": 0}, "created_at", 1, limit, cursor, response
+    )
 
 @api_router.post("/users", response_model=UserResponse)
 async def create_user(input: UserCreate, current_user: dict = Depends(require_role(["admin"]))):
@@ -345,11 +798,12 @@ async def create_user(input: UserCreate, current_user: dict = Depends(require_ro
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_pw = hash_password(input.password)
+    hashed_pw = await password_pool.run(hash_password, input.password)
     user_dict = input.model_dump(exclude={"password"})
     user_dict["id"] = str(uuid.uuid4())
-    user_dict["created_at"] = datetime.now(timezone.utc).isoformat()
+    user_dict["created_at"] = datetime.now(timezone.utc)
     user_dict["password_hash"] = hashed_pw
+    user_dict["token_version"] = 0
     
     await db.users.insert_one(user_dict)
     return UserResponse(**{k: v for k, v in user_dict.items() if k != "password_hash"})
@@ -358,18 +812,23 @@ async def create_user(input: UserCreate, current_user: dict = Depends(require_ro
 async def get_team_members(current_user: dict = Depends(require_role(["admin", "media_head"]))):
     """Get all team members - accessible by admin and media_head for task assignment"""
     users = await db.users.find({"role": "team_member"}, {"_id": 0, "password_hash": 0}).to_list(1000)
-    for user in users:
-        if isinstance(user.get('created_at'), str):
-            user['created_at'] = datetime.fromisoformat(user['created_at'])
     return users
 
+@api_router.get("/auth/password-pool-stats")
+async def get_password_pool_stats(current_user: dict = Depends(require_role(["admin"]))):
+    """Queueing metrics of the bcrypt worker pool"""
+    return password_pool.stats()
+
+@api_router.get("/users/cache-stats")
+async def get_user_cache_stats(current_user: dict = Depends(require_role(["admin"]))):
+    """Hit/miss counters of the user lookup cache, for sizing USER_CACHE_SIZE"""
+    return user_cache.stats()
+
 @api_router.get("/users/{user_id}", response_model=UserResponse)
 async def get_user(user_id: str, current_user: dict = Depends(require_role(["admin"]))):
     user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if isinstance(user.get('created_at'), str): 
-        user['created_at'] = datetime.fromisoformat(user['created_at'])
     return UserResponse(**user)
 
 @api_router.put("/users/{user_id}", response_model=UserResponse)
@@ -380,33 +839,220 @@ async def update_user(user_id: str, input: UserBase, current_user: dict = Depend
     
     update_dict = input.model_dump(exclude_unset=True)
     await db.users.update_one({"id": user_id}, {"$set": update_dict})
+    user_cache.evict(user_id)
+    
+    # Role and email are token claims; revoke tokens that carry the old values
+    if any(update_dict.get(field, user[field]) != user[field] for field in ("role", "email")):
+        await bump_token_version(user_id)
     
     updated_user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
-    if isinstance(updated_user.get('created_at'), str):
-        updated_user['created_at'] = datetime.fromisoformat(updated_user['created_at'])
     return UserResponse(**updated_user)
 
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+
+class SingleFlight:
+    """Concurrent identical reads share one computation instead of each running it.
+
+    The first caller for a key starts the computation as its own task; callers
+    arriving while it runs await the same task. Callers are shielded from
+    each other, so a client disconnecting does not cancel the work for the
+    rest. The key must cover everything the result depends on.
+    """
+
+    def __init__(self):
+        self.in_flight = {}  # key -> task
+        self.counts = {}  # (route, outcome) -> count
+
+    async def run(self, route: str, key: tuple, compute):
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self.in_flight[key] = task
+            task.add_done_callback(lambda _: self.finished(key, task))
+            outcome = "executed"
+        else:
+            outcome = "coalesced"
+        self.counts[(route, outcome)] = self.counts.get((route, outcome), 0) + 1
+        return await asyncio.shield(task)
+
+    def finished(self, key: tuple, task: asyncio.Task):
+        self.in_flight.pop(key, None)
+        # Every caller may have disconnected; mark a failure as seen so it isn't logged as unhandled
+        if not task.cancelled():
+            task.exception()
+
+    def render(self) -> str:
+        lines = [
+            "# HELP coalesced_requests_total Reads that ran a computation or joined one already in flight, by route template.",
+            "# TYPE coalesced_requests_total counter",
+        ]
+        for (route, outcome), count in sorted(self.counts.items()):
+            lines.append(f"coalesced_requests_total{metric_labels(route=route, outcome=outcome)} {count}")
+        return "\n".join(lines) + "\n"
+
+single_flight = SingleFlight()
+
+# ============================================================================
+# PUBLIC RESPONSE CACHE
+# ============================================================================
+
+# The anonymous endpoints behind the public pages keep their serialized
+# bodies in memory and answer If-None-Match with 304, and Cache-Control lets
+# a CDN serve them too. Each body depends on one or more data groups; writes
+# bump the group's version in cache_versions, and a body built from older
+# versions is rebuilt on its next request. This process sees its own bumps
+# at once and other workers' within PUBLIC_CACHE_REFRESH_SECONDS.
+PUBLIC_CACHE_SIZE = int(os.environ.get('PUBLIC_CACHE_SIZE', '256'))
+PUBLIC_CACHE_MAX_AGE_SECONDS = int(os.environ.get('PUBLIC_CACHE_MAX_AGE_SECONDS', '60'))
+PUBLIC_CACHE_REFRESH_SECONDS = float(os.environ.get('PUBLIC_CACHE_REFRESH_SECONDS', '5'))
+
+class PublicResponseCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # (path, query) -> (versions, etag, body, headers)
+        self.versions = {}
+        self.counts = {"hit": 0, "miss": 0, "not_modified": 0}
+        self.task = None
+
+    def versions_of(self, groups: List[str]) -> tuple:
+        return tuple(self.versions.get(group, 0) for group in groups)
+
+    def get(self, key: tuple, versions: tuple) -> Optional[tuple]:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != versions:
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: tuple):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def invalidate(self, *groups: str):
+        """Call after writing data that the given groups' responses are built from"""
+        for group in groups:
+            doc = await db.cache_versions.find_one_and_update(
+                {"_id": group}, {"$inc": {"version": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+            )
+            self.versions[group] = doc["version"]
+
+    async def refresh(self):
+        docs = await db.cache_versions.find({}).to_list(None)
+        self.versions.update({doc["_id"]: doc["version"] for doc in docs})
+
+    async def run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Public cache version refresh failed: {e}")
+            await asyncio.sleep(PUBLIC_CACHE_REFRESH_SECONDS)
+
+    def render(self) -> str:
+        lines = [
+            "# HELP public_cache_requests_total Requests to cached public endpoints, by outcome.",
+            "# TYPE public_cache_requests_total counter",
+        ]
+        for result, count in self.counts.items():
+            lines.append(f"public_cache_requests_total{metric_labels(result=result)} {count}")
+        return "\n".join(lines) + "\n"
+
+public_cache = PublicResponseCache(PUBLIC_CACHE_SIZE)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(","))
+
+async def cached_public_response(
+    request: Request,
+    groups: List[str],
+    adapter: TypeAdapter,
+    params: dict,
+    build,
+    max_age: int = PUBLIC_CACHE_MAX_AGE_SECONDS
+) -> Response:
+    """Serve build(response)'s rows from the cache, revalidating with ETags.
+
+    Entries are keyed by the endpoint's validated params rather than the raw
+    query string, so parameter order and unknown parameters don't split them.
+    build fills in a scratch Response, so headers such as the next-page
+    cursor are cached along with the body. Concurrent misses for the same
+    entry share one build. With max_age 0 clients and CDNs must revalidate
+    every time, which still costs only a 304 while nothing changed.
+    """
+    route = request.scope["route"].path
+    key = (route, tuple(sorted(params.items())))
+    versions = public_cache.versions_of(groups)
+    entry = public_cache.get(key, versions)
+    
+    async def build_entry() -> tuple:
+        scratch = Response()
+        body = adapter.dump_json(adapter.validate_python(await build(scratch)))
+        headers = {NEXT_CURSOR_HEADER: scratch.headers[NEXT_CURSOR_HEADER]} if NEXT_CURSOR_HEADER in scratch.headers else {}
+        built = (versions, f'"{hashlib.sha1(body).hexdigest()}"', body, headers)
+        public_cache.put(key, built)
+        return built
+    
+    if entry is None:
+        # Versions are part of the key, so requests arriving after a write
+        # never join a build that may have read the data before it
+        entry = await single_flight.run(route, key + versions, build_entry)
+        result = "miss"
+    else:
+        result = "hit"
+    
+    _, etag, body, headers = entry
+    cache_control = f"public, max-age={max_age}" if max_age else "no-cache"
+    headers = {**headers, "ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        public_cache.counts["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    public_cache.counts[result] += 1
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.on_event("startup")
+async def start_public_cache_refresh():
+    await public_cache.refresh()
+    public_cache.task = asyncio.create_task(public_cache.run())
+
+@app.on_event("shutdown")
+async def stop_public_cache_refresh():
+    if public_cache.task:
+        public_cache.task.cancel()
+
 # ============================================================================
 # INSTITUTION ROUTES
 # ============================================================================
 
+institution_list = TypeAdapter(List[Institution])
+
 @api_router.get("/institutions", response_model=List[Institution])
-async def get_institutions():
+async def get_institutions(
+    request: Request,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None
+):
     """Public read access to institutions - no auth required for public deliveries page"""
-    institutions = await db.institutions.find({}, {"_id": 0}).to_list(1000)
-    for inst in institutions:
-        if isinstance(inst.get('created_at'), str):
-            inst['created_at'] = datetime.fromisoformat(inst['created_at'])
-    return institutions
+    # Admins edit institutions and reload this list straight away, so it is never served stale
+    return await cached_public_response(
+        request, ["institutions"], institution_list, {"limit": limit, "cursor": cursor},
+        lambda response: find_page(db.institutions, {}, {"_id": 0}, "created_at", 1, limit, cursor, response),
+        max_age=0
+    )
 
 @api_router.post("/institutions", response_model=Institution)
 async def create_institution(input: InstitutionCreate, current_user: dict = Depends(require_role(["admin"]))):
     inst_dict = input.model_dump()
     inst_dict["id"] = str(uuid.uuid4())
-    inst_dict["created_at"] = datetime.now(timezone.utc).isoformat()
+    inst_dict["created_at"] = datetime.now(timezone.utc)
     
     await db.institutions.insert_one(inst_dict)
-    inst_dict['created_at'] = datetime.fromisoformat(inst_dict['created_at'])
+    await public_cache.invalidate("institutions")
     return Institution(**inst_dict)
 
 @api_router.get("/institutions/{institution_id}", response_model=Institution)
@@ -414,8 +1060,6 @@ async def get_institution(institution_id: str, current_user: dict = Depends(get_
     inst = await db.institutions.find_one({"id": institution_id}, {"_id": 0})
     if not inst:
         raise HTTPException(status_code=404, detail="Institution not found")
-    if isinstance(inst.get('created_at'), str):
-        inst['created_at'] = datetime.fromisoformat(inst['created_at'])
     return Institution(**inst)
 
 @api_router.put("/institutions/{institution_id}", response_model=Institution)
@@ -426,23 +1070,21 @@ async def update_institution(institution_id: str, input: InstitutionBase, curren
     
     update_dict = input.model_dump()
     await db.institutions.update_one({"id": institution_id}, {"$set": update_dict})
+    await db.public_deliveries.update_many(
+        {"institution_id": institution_id},
+        {"$set": {"institution_name": update_dict["name"]}}
+    )
+    # Public events and deliveries carry the institution name
+    await public_cache.invalidate("institutions", "events", "deliveries")
     
     updated = await db.institutions.find_one({"id": institution_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
     return Institution(**updated)
 
 # ============================================================================
 # EVENT ROUTES
 # ============================================================================
 
-@api_router.get("/events", response_model=List[EventResponse])
-async def get_events(
-    status: Optional[str] = None,
-    institution_id: Optional[str] = None,
-    priority: Optional[str] = None,
-    current_user: dict = Depends(get_current_user)
-):
+def event_list_query(status: Optional[str], institution_id: Optional[str], priority: Optional[str]) -> dict:
     query = {}
     if status:
         query["status"] = status
@@ -450,84 +1092,114 @@ async def get_events(
         query["institution_id"] = institution_id
     if priority:
         query["priority"] = priority
-    
-    events = await db.events.find(query, {"_id": 0}).sort("event_date_start", -1).to_list(1000)
+    return query
+
+@api_router.get("/events", response_model=List[EventResponse])
+async def get_events(
+    response: Response,
+    status: Optional[str] = None,
+    institution_id: Optional[str] = None,
+    priority: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    query = event_list_query(status, institution_id, priority)
+    events = await find_page(db.events, query, {"_id": 0}, "event_date_start", -1, limit, cursor, response)
     
     # Enrich with institution names
-    for event in events:
-        if isinstance(event.get('created_at'), str):
-            event['created_at'] = datetime.fromisoformat(event['created_at'])
-        if isinstance(event.get('event_date_start'), str):
-            event['event_date_start'] = datetime.fromisoformat(event['event_date_start'])
-        if event.get('event_date_end') and isinstance(event['event_date_end'], str):
-            event['event_date_end'] = datetime.fromisoformat(event['event_date_end'])
-        if event.get('deliverable_due_date') and isinstance(event['deliverable_due_date'], str):
-            event['deliverable_due_date'] = datetime.fromisoformat(event['deliverable_due_date'])
-        
-        inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
-        event["institution_name"] = inst["name"] if inst else None
+    await attach_related(events, "institution_id", db.institutions, "institution_name")
     
     return events
 
+public_event_list = TypeAdapter(List[PublicEvent])
+
 @api_router.get("/events/public", response_model=List[PublicEvent])
 async def get_events_public(
+    request: Request,
     institution_id: Optional[str] = None,
-    year: Optional[int] = None,
-    month: Optional[int] = None
+    year: Optional[int] = Query(None, ge=1, le=9998),
+    month: Optional[int] = Query(None, ge=1, le=12)
 ):
     """Public, read-only list of events for showcase pages"""
     query = {}
     if institution_id:
         query["institution_id"] = institution_id
+    if year and month:
+        start = datetime(year, month, 1, tzinfo=timezone.utc)
+        end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+        query["event_date_start"] = {"$gte": start, "$lt": end}
+    elif year:
+        query["event_date_start"] = {
+            "$gte": datetime(year, 1, 1, tzinfo=timezone.utc),
+            "$lt": datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+        }
+    elif month:
+        # The same month of every year can't be one index range
+        query["$expr"] = {"$eq": [{"$month": "$event_date_start"}, month]}
+
+    async def build(response: Response) -> List[dict]:
+        events = await db.events.find(query, {"_id": 0}).sort("event_date_start", -1).to_list(1000)
+        return await attach_related(events, "institution_id", db.institutions, "institution_name")
+    
+    return await cached_public_response(
+        request, ["events", "institutions"], public_event_list,
+        {"institution_id": institution_id, "year": year, "month": month}, build
+    )
 
-    events = await db.events.find(query, {"_id": 0}).sort("event_date_start", -1).to_list(1000)
-
-    public_events = []
-    for event in events:
-        if isinstance(event.get('event_date_start'), str):
-            event['event_date_start'] = datetime.fromisoformat(event['event_date_start'])
-        if event.get('event_date_end') and isinstance(event['event_date_end'], str):
-            event['event_date_end'] = datetime.fromisoformat(event['event_date_end'])
-
-        if year and event['event_date_start'].year != int(year):
-            continue
-        if month and event['event_date_start'].month != int(month):
-            continue
-
-        inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
-        event["institution_name"] = inst["name"] if inst else None
-
-        public_events.append(PublicEvent(**event))
-
-    public_events.sort(key=lambda e: e.event_date_start, reverse=True)
-    return public_events
+CALENDAR_MAX_RANGE_DAYS = 400
+CALENDAR_PROJECTION = {"_id": 0, **{field: 1 for field in CalendarEvent.model_fields if field != "institution_name"}}
+
+def overlap_query(start: datetime, end: datetime) -> dict:
+    """Events that overlap [start, end); an event without an end date lasts an instant.
+
+    Events occupy [event_date_start, event_date_end) too, so one ending
+    exactly at start belongs to the previous window only. Each branch is a
+    bounded range on its own index: events starting inside the window, and
+    events that started earlier but are still running.
+    """
+    return {"$or": [
+        {"event_date_start": {"$gte": start, "$lt": end}},
+        {"event_date_start": {"$lt": start}, "event_date_end": {"$gt": start}},
+    ]}
+
+@api_router.get("/events/range", response_model=List[CalendarEvent])
+async def get_events_range(
+    start: datetime,
+    end: datetime,
+    institution_id: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Compact view of the events overlapping a date window, for calendar rendering"""
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if end - start > timedelta(days=CALENDAR_MAX_RANGE_DAYS):
+        raise HTTPException(status_code=400, detail=f"Range cannot exceed {CALENDAR_MAX_RANGE_DAYS} days")
+    
+    query = overlap_query(start, end)
+    if institution_id:
+        query["institution_id"] = institution_id
+    events = await db.events.find(query, CALENDAR_PROJECTION).sort("event_date_start", 1).to_list(None)
+    return await attach_related(events, "institution_id", db.institutions, "institution_name")
 
 @api_router.post("/events", response_model=Event)
 async def create_event(input: EventCreate, current_user: dict = Depends(require_role(["admin", "media_head"]))):
     event_dict = input.model_dump()
     event_dict["id"] = str(uuid.uuid4())
     event_dict["created_by"] = current_user["id"]
-    event_dict["created_at"] = datetime.now(timezone.utc).isoformat()
-    
-    # Convert datetime fields to ISO strings
-    if isinstance(event_dict.get('event_date_start'), datetime):
-        event_dict['event_date_start'] = event_dict['event_date_start'].isoformat()
-    if event_dict.get('event_date_end') and isinstance(event_dict['event_date_end'], datetime):
-        event_dict['event_date_end'] = event_dict['event_date_end'].isoformat()
-    if event_dict.get('deliverable_due_date') and isinstance(event_dict['deliverable_due_date'], datetime):
-        event_dict['deliverable_due_date'] = event_dict['deliverable_due_date'].isoformat()
+    event_dict["created_at"] = datetime.now(timezone.utc)
+    event_dict["updated_at"] = event_dict["created_at"]
     
     await db.events.insert_one(event_dict)
+    await public_cache.invalidate("events")
     
-    # Convert back to datetime for response
-    event_dict['created_at'] = datetime.fromisoformat(event_dict['created_at'])
-    event_dict['event_date_start'] = datetime.fromisoformat(event_dict['event_date_start'])
-    if event_dict.get('event_date_end'):
-        event_dict['event_date_end'] = datetime.fromisoformat(event_dict['event_date_end'])
-    if event_dict.get('deliverable_due_date'):
-        event_dict['deliverable_due_date'] = datetime.fromisoformat(event_dict['deliverable_due_date'])
-    
-    return Event(**event_dict)
+    event = Event(**event_dict)
+    await broadcast_change("event", "created", event.id, event.model_dump())
+    return event
 
 @api_router.get("/events/{event_id}", response_model=EventResponse)
 async def get_event(event_id: str, current_user: dict = Depends(get_current_user)):
@@ -535,16 +1207,6 @@ async def get_event(event_id: str, current_user: dict = Depends(get_current_user
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Convert ISO strings to datetime
-    if isinstance(event.get('created_at'), str):
-        event['created_at'] = datetime.fromisoformat(event['created_at'])
-    if isinstance(event.get('event_date_start'), str):
-        event['event_date_start'] = datetime.fromisoformat(event['event_date_start'])
-    if event.get('event_date_end') and isinstance(event['event_date_end'], str):
-        event['event_date_end'] = datetime.fromisoformat(event['event_date_end'])
-    if event.get('deliverable_due_date') and isinstance(event['deliverable_due_date'], str):
-        event['deliverable_due_date'] = datetime.fromisoformat(event['deliverable_due_date'])
-    
     # Add institution name
     inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
     event["institution_name"] = inst["name"] if inst else None
@@ -558,42 +1220,60 @@ async def update_event(event_id: str, input: EventBase, current_user: dict = Dep
         raise HTTPException(status_code=404, detail="Event not found")
     
     update_dict = input.model_dump()
-    
-    # Convert datetime fields to ISO strings
-    if isinstance(update_dict.get('event_date_start'), datetime):
-        update_dict['event_date_start'] = update_dict['event_date_start'].isoformat()
-    if update_dict.get('event_date_end') and isinstance(update_dict['event_date_end'], datetime):
-        update_dict['event_date_end'] = update_dict['event_date_end'].isoformat()
-    if update_dict.get('deliverable_due_date') and isinstance(update_dict['deliverable_due_date'], datetime):
-        update_dict['deliverable_due_date'] = update_dict['deliverable_due_date'].isoformat()
-    
-    await db.events.update_one({"id": event_id}, {"$set": update_dict})
+    update_dict["updated_at"] = datetime.now(timezone.utc)
+    dates_changed = any(event.get(field) != update_dict[field] for field in ("event_date_start", "event_date_end"))
+    async with allocation_lock:
+        if dates_changed:
+            # Moving the event moves its bookings, which must not double-book equipment
+            start, end = allocation_window(update_dict)
+            conflicts = await find_allocation_conflicts(event_id, start, end)
+            if conflicts:
+                raise HTTPException(
+                    status_code=409,
+                    detail={
+                        "message": "Equipment allocated to this event is booked for an overlapping event",
+                        "conflicts": jsonable_encoder(conflicts)
+                    }
+                )
+        await db.events.update_one({"id": event_id}, {"$set": update_dict})
+        if dates_changed:
+            await sync_allocation_windows(event_id)
+    await public_cache.invalidate("events")
+    await sync_public_deliveries_for_event(event_id)
+    await broadcast_change("event", "updated", event_id, changed_fields(event, update_dict))
     
     updated = await db.events.find_one({"id": event_id}, {"_id": 0})
-    
-    # Convert back to datetime
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    if isinstance(updated.get('event_date_start'), str):
-        updated['event_date_start'] = datetime.fromisoformat(updated['event_date_start'])
-    if updated.get('event_date_end') and isinstance(updated['event_date_end'], str):
-        updated['event_date_end'] = datetime.fromisoformat(updated['event_date_end'])
-    if updated.get('deliverable_due_date') and isinstance(updated['deliverable_due_date'], str):
-        updated['deliverable_due_date'] = datetime.fromisoformat(updated['deliverable_due_date'])
-    
     return Event(**updated)
 
 # ============================================================================
 # TASK ROUTES
 # ============================================================================
 
-@api_router.get("/tasks", response_model=List[TaskResponse])
-async def get_tasks(
-    status: Optional[str] = None,
-    assigned_to: Optional[str] = None,
-    event_id: Optional[str] = None,
-    current_user: dict = Depends(get_current_user)
-):
+# Aggregation stages that join a task with its event, the event's institution
+# and the assigned user in a single round-trip instead of one find_one per row.
+TASK_ENRICHMENT_STAGES = [
+    {"$lookup": {"from": "events", "localField": "event_id", "foreignField": "id", "as": "event"}},
+    {"$unwind": {"path": "$event", "preserveNullAndEmptyArrays": True}},
+    {"$lookup": {"from": "institutions", "localField": "event.institution_id", "foreignField": "id", "as": "institution"}},
+    {"$lookup": {"from": "users", "localField": "assigned_to", "foreignField": "id", "as": "assignee"}},
+    {"$addFields": {
+        "event_title": "$event.title",
+        "event_date": "$event.event_date_start",
+        "institution_name": {"$arrayElemAt": ["$institution.name", 0]},
+        "assigned_to_name": {"$arrayElemAt": ["$assignee.name", 0]},
+    }},
+    {"$project": {"_id": 0, "event": 0, "institution": 0, "assignee": 0}},
+]
+
+TASK_BULK_MODES = ["atomic", "ordered"]
+TASK_BULK_LIMIT = 1000
+
+def task_list_query(
+    status: Optional[str],
+    assigned_to: Optional[str],
+    event_id: Optional[str],
+    current_user: dict
+) -> dict:
     query = {}
     if status:
         query["status"] = status
@@ -605,42 +1285,37 @@ async def get_tasks(
         query["assigned_to"] = current_user["id"]
     elif assigned_to:
         query["assigned_to"] = assigned_to
+    return query
+
+@api_router.get("/tasks", response_model=List[TaskResponse])
+async def get_tasks(
+    response: Response,
+    status: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    event_id: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    query = task_list_query(status, assigned_to, event_id, current_user)
+    tasks = await db.tasks.aggregate([
+        {"$match": keyset_query(query, cursor, "due_date", 1)},
+        {"$sort": dict(keyset_sort("due_date", 1))},
+        {"$limit": limit + 1}
+    ] + TASK_ENRICHMENT_STAGES).to_list(limit + 1)
     
-    tasks = await db.tasks.find(query, {"_id": 0}).sort("due_date", 1).to_list(1000)
-    
-    # Enrich with event and user details
-    for task in tasks:
-        if isinstance(task.get('created_at'), str):
-            task['created_at'] = datetime.fromisoformat(task['created_at'])
-        if task.get('due_date') and isinstance(task['due_date'], str):
-            task['due_date'] = datetime.fromisoformat(task['due_date'])
-        
-        event = await db.events.find_one({"id": task["event_id"]}, {"_id": 0})
-        if event:
-            task["event_title"] = event.get("title")
-            if isinstance(event.get('event_date_start'), str):
-                task["event_date"] = datetime.fromisoformat(event['event_date_start'])
-            else:
-                task["event_date"] = event.get("event_date_start")
-            
-            inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
-            task["institution_name"] = inst["name"] if inst else None
-        
-        user = await db.users.find_one({"id": task["assigned_to"]}, {"_id": 0})
-        task["assigned_to_name"] = user["name"] if user else None
-    
-    return tasks
+    return finish_page(tasks, limit, "due_date", response)
 
 @api_router.post("/tasks", response_model=Task)
 async def create_task(input: TaskCreate, current_user: dict = Depends(require_role(["admin", "media_head"]))):
     task_dict = input.model_dump()
     task_dict["id"] = str(uuid.uuid4())
-    task_dict["created_at"] = datetime.now(timezone.utc).isoformat()
-    
-    if task_dict.get('due_date') and isinstance(task_dict['due_date'], datetime):
-        task_dict['due_date'] = task_dict['due_date'].isoformat()
+    task_dict["created_at"] = datetime.now(timezone.utc)
+    task_dict["updated_at"] = task_dict["created_at"]
     
     await db.tasks.insert_one(task_dict)
+    if task_dict["status"] == "completed":
+        await sync_public_delivery(task_dict["id"])
     
     # Get event title for notification
     event = await db.events.find_one({"id": task_dict["event_id"]}, {"_id": 0})
@@ -655,11 +1330,93 @@ async def create_task(input: TaskCreate, current_user: dict = Depends(require_ro
         related_id=task_dict["id"]
     )
     
-    task_dict['created_at'] = datetime.fromisoformat(task_dict['created_at'])
-    if task_dict.get('due_date'):
-        task_dict['due_date'] = datetime.fromisoformat(task_dict['due_date'])
+    task = Task(**task_dict)
+    await broadcast_change("task", "created", task.id, task.model_dump(), audience=[task.assigned_to])
+    return task
+
+@api_router.post("/tasks/bulk", response_model=TaskBulkResponse)
+async def create_tasks_bulk(input: TaskBulkCreate, current_user: dict = Depends(require_role(["admin", "media_head"]))):
+    """Create many tasks with one insert.
+
+    In "atomic" mode nothing is written unless every task is valid. In
+    "ordered" mode tasks are written in order up to the first failure and
+    the rest are reported as skipped.
+    """
+    if input.mode not in TASK_BULK_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of: {', '.join(TASK_BULK_MODES)}")
+    if len(input.tasks) > TASK_BULK_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {TASK_BULK_LIMIT} tasks per request")
+    
+    # Every referenced event and assignee is resolved with one query each
+    events, users = await asyncio.gather(
+        fetch_by_ids(db.events, (task.event_id for task in input.tasks), ["title"]),
+        fetch_by_ids(db.users, (task.assigned_to for task in input.tasks), [])
+    )
     
-    return Task(**task_dict)
+    now = datetime.now(timezone.utc)
+    results = []
+    task_dicts = []
+    for index, task in enumerate(input.tasks):
+        if task.event_id not in events:
+            results.append(TaskBulkResult(index=index, status="error", error="Event not found"))
+        elif task.assigned_to not in users:
+            results.append(TaskBulkResult(index=index, status="error", error="Assigned user not found"))
+        else:
+            task_dict = task.model_dump()
+            task_dict["id"] = str(uuid.uuid4())
+            task_dict["created_at"] = now
+            task_dict["updated_at"] = now
+            results.append(TaskBulkResult(index=index, status="created", id=task_dict["id"]))
+            task_dicts.append(task_dict)
+            continue
+        if input.mode == "ordered":
+            break
+    
+    if len(task_dicts) < len(input.tasks):
+        if input.mode == "atomic":
+            raise HTTPException(
+                status_code=400,
+                detail=[result.model_dump() for result in results if result.status == "error"]
+            )
+        results += [TaskBulkResult(index=index, status="skipped") for index in range(len(results), len(input.tasks))]
+    
+    if task_dicts:
+        try:
+            await db.tasks.insert_many(task_dicts, ordered=True)
+        except BulkWriteError as e:
+            inserted = e.details["nInserted"]
+            if input.mode == "atomic":
+                rolled_back = [task["id"] for task in task_dicts[:inserted]]
+                await db.tasks.delete_many({"id": {"$in": rolled_back}})
+                # A /sync between the insert and the rollback may have returned them
+                await record_deletions("tasks", rolled_back)
+                raise HTTPException(status_code=500, detail="Bulk insert failed, no tasks were created")
+            failed = e.details["writeErrors"][0]["errmsg"]
+            created_results = [result for result in results if result.status == "created"]
+            created_results[inserted].status = "error"
+            created_results[inserted].error = failed
+            for result in created_results[inserted + 1:]:
+                result.status = "skipped"
+            for result in created_results[inserted:]:
+                result.id = None
+            task_dicts = task_dicts[:inserted]
+    
+    await upsert_public_deliveries([task for task in task_dicts if task["status"] == "completed"])
+    await notification_outbox.enqueue_many([
+        build_notification(
+            user_id=task_dict["assigned_to"],
+            title="New Task Assigned",
+            message=f"You have been assigned a {task_dict['type']} task for {events[task_dict['event_id']]['title']}",
+            notif_type="task_assigned",
+            related_id=task_dict["id"]
+        )
+        for task_dict in task_dicts
+    ])
+    for task_dict in task_dicts:
+        task = Task(**task_dict)
+        await broadcast_change("task", "created", task.id, task.model_dump(), audience=[task.assigned_to])
+    
+    return TaskBulkResponse(created=len(task_dicts), results=results)
 
 @api_router.post("/events/{event_id}/deliverables", response_model=Task)
 async def create_manual_deliverable(
@@ -680,44 +1437,28 @@ async def create_manual_deliverable(
         "status": "completed",
         "deliverable_link": input.deliverable_link,
         "comments": input.comments,
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
+    task_dict["updated_at"] = task_dict["created_at"]
 
     await db.tasks.insert_one(task_dict)
+    await sync_public_delivery(task_dict["id"])
 
-    task_dict['created_at'] = datetime.fromisoformat(task_dict['created_at'])
-    return Task(**task_dict)
+    task = Task(**task_dict)
+    await broadcast_change("task", "created", task.id, task.model_dump(), audience=[task.assigned_to])
+    return task
 
 @api_router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(task_id: str, current_user: dict = Depends(get_current_user)):
-    task = await db.tasks.find_one({"id": task_id}, {"_id": 0})
-    if not task:
+    tasks = await db.tasks.aggregate([{"$match": {"id": task_id}}] + TASK_ENRICHMENT_STAGES).to_list(1)
+    if not tasks:
         raise HTTPException(status_code=404, detail="Task not found")
+    task = tasks[0]
     
     # Team members can only access their own tasks
     if current_user["role"] == "team_member" and task["assigned_to"] != current_user["id"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    if isinstance(task.get('created_at'), str):
-        task['created_at'] = datetime.fromisoformat(task['created_at'])
-    if task.get('due_date') and isinstance(task['due_date'], str):
-        task['due_date'] = datetime.fromisoformat(task['due_date'])
-    
-    # Add event details
-    event = await db.events.find_one({"id": task["event_id"]}, {"_id": 0})
-    if event:
-        task["event_title"] = event.get("title")
-        if isinstance(event.get('event_date_start'), str):
-            task["event_date"] = datetime.fromisoformat(event['event_date_start'])
-        else:
-            task["event_date"] = event.get("event_date_start")
-        
-        inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
-        task["institution_name"] = inst["name"] if inst else None
-    
-    user = await db.users.find_one({"id": task["assigned_to"]}, {"_id": 0})
-    task["assigned_to_name"] = user["name"] if user else None
-    
     return TaskResponse(**task)
 
 @api_router.put("/tasks/{task_id}", response_model=Task)
@@ -737,10 +1478,17 @@ async def update_task(task_id: str, input: TaskBase, current_user: dict = Depend
         update_dict = {k: v for k, v in input.model_dump().items() if k in allowed_fields}
     else:
         update_dict = input.model_dump()
-        if update_dict.get('due_date') and isinstance(update_dict['due_date'], datetime):
-            update_dict['due_date'] = update_dict['due_date'].isoformat()
+    update_dict["updated_at"] = datetime.now(timezone.utc)
     
     await db.tasks.update_one({"id": task_id}, {"$set": update_dict})
+    if update_dict.get("assigned_to", task["assigned_to"]) != task["assigned_to"]:
+        # The previous assignee's /sync would otherwise keep the task forever
+        await record_deletions("tasks", [task_id], user_id=task["assigned_to"])
+    await sync_public_delivery(task_id)
+    await broadcast_change(
+        "task", "updated", task_id, changed_fields(task, update_dict),
+        audience=[task["assigned_to"], update_dict.get("assigned_to", task["assigned_to"])]
+    )
     
     # Send notification if task is marked as completed
     new_status = update_dict.get("status", old_status)
@@ -751,22 +1499,15 @@ async def update_task(task_id: str, input: TaskBase, current_user: dict = Depend
         
         # Notify event creator/media head
         if event and event.get("created_by"):
-            user = await db.users.find_one({"id": current_user["id"]}, {"_id": 0})
-            user_name = user["name"] if user else "Team member"
             await create_notification(
                 user_id=event["created_by"],
                 title="Task Completed",
-                message=f"{user_name} completed {task['type']} task for {event_title}",
+                message=f"{current_user['name']} completed {task['type']} task for {event_title}",
                 notif_type="task_completed",
                 related_id=task_id
             )
     
     updated = await db.tasks.find_one({"id": task_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
-    if updated.get('due_date') and isinstance(updated['due_date'], str):
-        updated['due_date'] = datetime.fromisoformat(updated['due_date'])
-    
     return Task(**updated)
 
 # ============================================================================
@@ -774,21 +1515,22 @@ async def update_task(task_id: str, input: TaskBase, current_user: dict = Depend
 # ============================================================================
 
 @api_router.get("/equipment", response_model=List[Equipment])
-async def get_equipment(current_user: dict = Depends(get_current_user)):
-    equipment_list = await db.equipment.find({}, {"_id": 0}).to_list(1000)
-    for eq in equipment_list:
-        if isinstance(eq.get('created_at'), str):
-            eq['created_at'] = datetime.fromisoformat(eq['created_at'])
-    return equipment_list
+async def get_equipment(
+    response: Response,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    return await find_page(db.equipment, {}, {"_id": 0}, "created_at", 1, limit, cursor, response)
 
 @api_router.post("/equipment", response_model=Equipment)
 async def create_equipment(input: EquipmentCreate, current_user: dict = Depends(require_role(["admin"]))):
     eq_dict = input.model_dump()
     eq_dict["id"] = str(uuid.uuid4())
-    eq_dict["created_at"] = datetime.now(timezone.utc).isoformat()
+    eq_dict["created_at"] = datetime.now(timezone.utc)
+    eq_dict["updated_at"] = eq_dict["created_at"]
     
     await db.equipment.insert_one(eq_dict)
-    eq_dict['created_at'] = datetime.fromisoformat(eq_dict['created_at'])
     return Equipment(**eq_dict)
 
 @api_router.put("/equipment/{equipment_id}", response_model=Equipment)
@@ -798,37 +1540,203 @@ async def update_equipment(equipment_id: str, input: EquipmentBase, current_user
         raise HTTPException(status_code=404, detail="Equipment not found")
     
     update_dict = input.model_dump()
+    update_dict["updated_at"] = datetime.now(timezone.utc)
     await db.equipment.update_one({"id": equipment_id}, {"$set": update_dict})
     
     updated = await db.equipment.find_one({"id": equipment_id}, {"_id": 0})
-    if isinstance(updated.get('created_at'), str):
-        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
     return Equipment(**updated)
 
 # ============================================================================
 # EQUIPMENT ALLOCATION ROUTES
 # ============================================================================
 
+# An allocation books its item for the event's time window. Events without
+# an end time are assumed to take this long.
+EQUIPMENT_DEFAULT_BOOKING = timedelta(hours=int(os.environ.get('EQUIPMENT_DEFAULT_BOOKING_HOURS', '24')))
+EQUIPMENT_INDEX_TTL_SECONDS = float(os.environ.get('EQUIPMENT_INDEX_TTL_SECONDS', '30'))
+
+def allocation_window(event: dict) -> tuple:
+    start = event["event_date_start"]
+    end = event.get("event_date_end")
+    if not end or end <= start:
+        end = start + EQUIPMENT_DEFAULT_BOOKING
+    return start, end
+
+class AllocationIndex:
+    """In-process interval index of allocation windows, used to answer availability.
+
+    Windows are sorted by start with a max-of-ends segment tree on top, so a
+    query only descends into subtrees that hold an overlapping window: the
+    cost grows with the number of matches, not with the number of allocations.
+    Allocations made by this worker since the last load sit in a short list
+    that is scanned directly. The index is reloaded once older than the TTL,
+    which bounds how long bookings made by other workers stay invisible.
+    Rejecting conflicting allocations does not rely on it and queries the
+    database instead.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.starts = []
+        self.equipment_ids = []
+        self.size = 1
+        self.max_ends = [float("-inf")] * 2
+        self.recent = []
+        self.expires_at = 0.0
+        self.lock = asyncio.Lock()
+
+    async def ensure_loaded(self):
+        async with self.lock:
+            if time.monotonic() < self.expires_at:
+                return
+            # Allocations added before the query are in its snapshot; later ones
+            # may not be, so they stay in recent after the rebuild
+            snapshot_mark = len(self.recent)
+            windows = []
+            async for alloc in db.equipment_allocations.find(
+                {"starts_at": {"$ne": None}}, {"_id": 0, "equipment_id": 1, "starts_at": 1, "ends_at": 1}
+            ):
+                windows.append((alloc["starts_at"].timestamp(), alloc["ends_at"].timestamp(), alloc["equipment_id"]))
+            self.build(windows)
+            self.recent = self.recent[snapshot_mark:]
+            self.expires_at = time.monotonic() + self.ttl_seconds
+
+    def build(self, windows: List[tuple]):
+        windows.sort()
+        self.starts = [window[0] for window in windows]
+        self.equipment_ids = [window[2] for window in windows]
+        self.size = 1
+        while self.size < len(windows):
+            self.size *= 2
+        self.max_ends = [float("-inf")] * (2 * self.size)
+        for i, window in enumerate(windows):
+            self.max_ends[self.size + i] = window[1]
+        for node in range(self.size - 1, 0, -1):
+            self.max_ends[node] = max(self.max_ends[2 * node], self.max_ends[2 * node + 1])
+
+    def add(self, equipment_id: str, start: datetime, end: datetime):
+        self.recent.append((start.timestamp(), end.timestamp(), equipment_id))
+
+    def invalidate(self):
+        self.expires_at = 0.0
+
+    def busy(self, start: datetime, end: datetime) -> set:
+        """Ids of equipment with a window overlapping [start, end)"""
+        start, end = start.timestamp(), end.timestamp()
+        busy = {equipment_id for s, e, equipment_id in self.recent if s < end and e > start}
+        # Only windows starting before end can overlap; find those ending after start
+        limit = bisect.bisect_left(self.starts, end)
+        stack = [(1, 0, self.size)] if limit else []
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= limit or self.max_ends[node] <= start:
+                continue
+            if hi - lo == 1:
+                busy.add(self.equipment_ids[lo])
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node, lo, mid))
+            stack.append((2 * node + 1, mid, hi))
+        return busy
+
+allocation_index = AllocationIndex(EQUIPMENT_INDEX_TTL_SECONDS)
+# Serializes the conflict check and insert within this worker
+allocation_lock = asyncio.Lock()
+
+async def find_allocation_conflicts(event_id: str, start: datetime, end: datetime) -> list:
+    """Other events' allocations that overlap [start, end) on equipment allocated to this event"""
+    equipment_ids = await db.equipment_allocations.distinct("equipment_id", {"event_id": event_id})
+    if not equipment_ids:
+        return []
+    conflicts = await db.equipment_allocations.find(
+        {
+            "equipment_id": {"$in": equipment_ids},
+            "event_id": {"$ne": event_id},
+            "starts_at": {"$lt": end},
+            "ends_at": {"$gt": start}
+        },
+        {"_id": 0}
+    ).to_list(None)
+    await asyncio.gather(
+        attach_related(conflicts, "equipment_id", db.equipment, "equipment_name"),
+        attach_related(conflicts, "event_id", db.events, "event_title", source_field="title")
+    )
+    return conflicts
+
+async def sync_allocation_windows(event_id: str):
+    event = await db.events.find_one({"id": event_id}, {"_id": 0, "event_date_start": 1, "event_date_end": 1})
+    if not event:
+        return
+    allocation_ids = await db.equipment_allocations.distinct("id", {"event_id": event_id})
+    if not allocation_ids:
+        return
+    start, end = allocation_window(event)
+    fields = {"starts_at": start, "ends_at": end, "updated_at": datetime.now(timezone.utc)}
+    await db.equipment_allocations.update_many({"event_id": event_id}, {"$set": fields})
+    allocation_index.invalidate()
+    for allocation_id in allocation_ids:
+        await broadcast_change("equipment_allocation", "updated", allocation_id, fields)
+
+@app.on_event("startup")
+async def init_allocation_windows():
+    # Allocations made before windows were stored get them from their event
+    missing = await db.equipment_allocations.find(
+        {"starts_at": {"$exists": False}}, {"_id": 0, "id": 1, "event_id": 1}
+    ).to_list(None)
+    if not missing:
+        return
+    events = await fetch_by_ids(db.events, (alloc["event_id"] for alloc in missing), ["event_date_start", "event_date_end"])
+    now = datetime.now(timezone.utc)
+    updates = {}
+    for alloc in missing:
+        event = events.get(alloc["event_id"])
+        start, end = allocation_window(event) if event else (None, None)
+        updates[alloc["id"]] = {"starts_at": start, "ends_at": end, "updated_at": now}
+    ops = [UpdateOne({"id": alloc_id}, {"$set": fields}) for alloc_id, fields in updates.items()]
+    await db.equipment_allocations.bulk_write(ops, ordered=False)
+    for alloc_id, fields in updates.items():
+        await broadcast_change("equipment_allocation", "updated", alloc_id, fields)
+    logger.info(f"Stored booking windows on {len(ops)} equipment allocation(s)")
+
+@api_router.get("/equipment/availability", response_model=List[Equipment])
+async def get_equipment_availability(
+    start: datetime,
+    end: datetime,
+    current_user: dict = Depends(get_current_user)
+):
+    """Equipment not allocated to any event overlapping [start, end) and not under maintenance"""
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    
+    await allocation_index.ensure_loaded()
+    busy = allocation_index.busy(start, end)
+    equipment = await db.equipment.find({"status": {"$ne": "maintenance"}}, {"_id": 0}).sort("name", 1).to_list(None)
+    return [item for item in equipment if item["id"] not in busy]
+
 @api_router.get("/equipment-allocations", response_model=List[EquipmentAllocationResponse])
 async def get_equipment_allocations(
+    response: Response,
     event_id: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     query = {}
     if event_id:
         query["event_id"] = event_id
     
-    allocations = await db.equipment_allocations.find(query, {"_id": 0}).to_list(1000)
+    allocations = await find_page(
+        db.equipment_allocations, query, {"_id": 0}, "created_at", 1, limit, cursor, response
+    )
     
-    for alloc in allocations:
-        if isinstance(alloc.get('created_at'), str):
-            alloc['created_at'] = datetime.fromisoformat(alloc['created_at'])
-        
-        eq = await db.equipment.find_one({"id": alloc["equipment_id"]}, {"_id": 0})
-        alloc["equipment_name"] = eq["name"] if eq else None
-        
-        event = await db.events.find_one({"id": alloc["event_id"]}, {"_id": 0})
-        alloc["event_title"] = event["title"] if event else None
+    await asyncio.gather(
+        attach_related(allocations, "equipment_id", db.equipment, "equipment_name"),
+        attach_related(allocations, "event_id", db.events, "event_title", source_field="title")
+    )
     
     return allocations
 
@@ -837,104 +1745,519 @@ async def create_equipment_allocation(
     input: EquipmentAllocationCreate,
     current_user: dict = Depends(require_role(["admin", "media_head"]))
 ):
-    alloc_dict = input.model_dump()
-    alloc_dict["id"] = str(uuid.uuid4())
-    alloc_dict["allocated_by"] = current_user["id"]
-    alloc_dict["created_at"] = datetime.now(timezone.utc).isoformat()
+    event = await db.events.find_one({"id": input.event_id}, {"_id": 0})
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if not await db.equipment.find_one({"id": input.equipment_id}, {"_id": 0, "id": 1}):
+        raise HTTPException(status_code=404, detail="Equipment not found")
+    start, end = allocation_window(event)
     
-    await db.equipment_allocations.insert_one(alloc_dict)
-    alloc_dict['created_at'] = datetime.fromisoformat(alloc_dict['created_at'])
-    return EquipmentAllocation(**alloc_dict)
+    async with allocation_lock:
+        # Authoritative overlap check on the (equipment_id, starts_at, ends_at) index
+        conflict = await db.equipment_allocations.find_one(
+            {"equipment_id": input.equipment_id, "starts_at": {"$lt": end}, "ends_at": {"$gt": start}},
+            {"_id": 0, "event_id": 1}
+        )
+        if conflict:
+            other = await db.events.find_one({"id": conflict["event_id"]}, {"_id": 0, "title": 1})
+            title = other["title"] if other else conflict["event_id"]
+            raise HTTPException(
+                status_code=409,
+                detail=f"Equipment is already allocated to an overlapping event: {title}"
+            )
+        
+        alloc_dict = input.model_dump()
+        alloc_dict["id"] = str(uuid.uuid4())
+        alloc_dict["allocated_by"] = current_user["id"]
+        alloc_dict["starts_at"] = start
+        alloc_dict["ends_at"] = end
+        alloc_dict["created_at"] = datetime.now(timezone.utc)
+        alloc_dict["updated_at"] = alloc_dict["created_at"]
+        await db.equipment_allocations.insert_one(alloc_dict)
+        allocation_index.add(input.equipment_id, start, end)
+    
+    allocation = EquipmentAllocation(**alloc_dict)
+    await broadcast_change("equipment_allocation", "created", allocation.id, allocation.model_dump())
+    return allocation
+
+# ============================================================================
+# PUBLIC DELIVERIES READ MODEL
+# ============================================================================
+
+# public_deliveries holds one denormalized row per completed task with a
+# deliverable link, so the anonymous deliveries endpoint is a single indexed
+# query. Rows are keyed by the task id and refreshed by every write that can
+# change their contents.
+PUBLIC_DELIVERY_TASK_QUERY = {"status": "completed", "deliverable_link": {"$nin": [None, ""]}}
+
+def build_public_delivery(task: dict, event: dict, inst: Optional[dict]) -> dict:
+    return {
+        "id": task["id"],
+        "event_id": task["event_id"],
+        "event_title": event["title"],
+        "institution_id": event["institution_id"],
+        "institution_name": inst["name"] if inst else "Unknown",
+        "event_date": event.get("event_date_start"),
+        "task_type": task["type"],
+        "deliverable_link": task["deliverable_link"],
+        "priority": event.get("priority", "normal"),
+        "completed_at": task.get("created_at", datetime.now(timezone.utc))
+    }
+
+async def sync_public_delivery(task_id: str):
+    """Insert, refresh or remove the public_deliveries row for a single task"""
+    task = await db.tasks.find_one({"id": task_id, **PUBLIC_DELIVERY_TASK_QUERY}, {"_id": 0})
+    event = await db.events.find_one({"id": task["event_id"]}, {"_id": 0}) if task else None
+    if not event:
+        result = await db.public_deliveries.delete_one({"id": task_id})
+        changed = result.deleted_count
+    else:
+        inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
+        result = await db.public_deliveries.replace_one(
+            {"id": task_id},
+            build_public_delivery(task, event, inst),
+            upsert=True
+        )
+        changed = result.modified_count or result.upserted_id
+    # Most task writes leave the public row as it was
+    if changed:
+        await public_cache.invalidate("deliveries")
+
+async def upsert_public_deliveries(tasks: List[dict]):
+    """Write the public_deliveries rows of many completed tasks with one bulk write"""
+    tasks = [task for task in tasks if task.get("deliverable_link")]
+    if not tasks:
+        return
+    events = await fetch_by_ids(
+        db.events,
+        (task["event_id"] for task in tasks),
+        ["title", "institution_id", "event_date_start", "priority"]
+    )
+    institutions = await fetch_by_ids(db.institutions, (e["institution_id"] for e in events.values()), ["name"])
+    
+    operations = []
+    for task in tasks:
+        event = events.get(task["event_id"])
+        if event:
+            row = build_public_delivery(task, event, institutions.get(event["institution_id"]))
+            operations.append(ReplaceOne({"id": task["id"]}, row, upsert=True))
+    if operations:
+        await db.public_deliveries.bulk_write(operations, ordered=False)
+        await public_cache.invalidate("deliveries")
+
+async def sync_public_deliveries_for_event(event_id: str):
+    """Propagate event fields to every public_deliveries row of the event"""
+    event = await db.events.find_one({"id": event_id}, {"_id": 0})
+    if not event:
+        result = await db.public_deliveries.delete_many({"event_id": event_id})
+        changed = result.deleted_count
+    else:
+        inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
+        result = await db.public_deliveries.update_many(
+            {"event_id": event_id},
+            {"$set": {
+                "event_title": event["title"],
+                "institution_id": event["institution_id"],
+                "institution_name": inst["name"] if inst else "Unknown",
+                "event_date": event.get("event_date_start"),
+                "priority": event.get("priority", "normal")
+            }}
+        )
+        changed = result.modified_count
+    if changed:
+        await public_cache.invalidate("deliveries")
+
+async def rebuild_public_deliveries() -> int:
+    """Recompute the whole read model from tasks, events and institutions"""
+    tasks = await db.tasks.find(PUBLIC_DELIVERY_TASK_QUERY, {"_id": 0}).to_list(None)
+    events = await fetch_by_ids(
+        db.events,
+        (task["event_id"] for task in tasks),
+        ["title", "institution_id", "event_date_start", "priority"]
+    )
+    institutions = await fetch_by_ids(db.institutions, (e["institution_id"] for e in events.values()), ["name"])
+    
+    rows = []
+    for task in tasks:
+        event = events.get(task["event_id"])
+        if event:
+            rows.append(build_public_delivery(task, event, institutions.get(event["institution_id"])))
+    
+    await db.public_deliveries.delete_many({})
+    if rows:
+        await db.public_deliveries.insert_many(rows)
+    await public_cache.invalidate("deliveries")
+    return len(rows)
+
+@app.on_event("startup")
+async def init_public_deliveries():
+    # Backfill on first boot after the read model was introduced
+    if await db.public_deliveries.estimated_document_count() == 0:
+        count = await rebuild_public_deliveries()
+        logger.info(f"Built public_deliveries read model with {count} rows")
 
 # ============================================================================
 # PUBLIC DELIVERIES ROUTE
 # ============================================================================
 
+def delivery_list_query(institution_id: Optional[str], task_type: Optional[str]) -> dict:
+    query = {}
+    if institution_id:
+        query["institution_id"] = institution_id
+    if task_type:
+        query["task_type"] = task_type
+    return query
+
+public_delivery_list = TypeAdapter(List[DeliverablePublic])
+
 @api_router.get("/deliveries/public", response_model=List[DeliverablePublic])
 async def get_public_deliveries(
+    request: Request,
     institution_id: Optional[str] = None,
-    task_type: Optional[str] = None
+    task_type: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE_LIMIT, ge=1, le=PAGE_SIZE_LIMIT),
+    cursor: Optional[str] = None
 ):
-    # Find completed tasks with deliverable links
-    query = {"status": "completed", "deliverable_link": {"$ne": None, "$ne": ""}}
-    tasks = await db.tasks.find(query, {"_id": 0}).to_list(1000)
+    return await cached_public_response(
+        request, ["deliveries"], public_delivery_list,
+        {"institution_id": institution_id, "task_type": task_type, "limit": limit, "cursor": cursor},
+        lambda response: find_page(
+            db.public_deliveries, delivery_list_query(institution_id, task_type), {"_id": 0},
+            "completed_at", -1, limit, cursor, response
+        )
+    )
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+EXPORT_CHUNK_ROWS = 500
+
+EVENT_ENRICHMENT_STAGES = [
+    {"$lookup": {"from": "institutions", "localField": "institution_id", "foreignField": "id", "as": "institution"}},
+    {"$addFields": {"institution_name": {"$arrayElemAt": ["$institution.name", 0]}}},
+    {"$project": {"_id": 0, "institution": 0}},
+]
+
+def csv_line(values: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+def csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    return value
+
+async def export_rows(cursor, model, fmt: str):
+    """Serialize documents from a Motor cursor as they arrive, a chunk of rows at a time"""
+    columns = list(model.model_fields)
+    chunk = [csv_line(columns)] if fmt == "csv" else []
+    async for doc in cursor:
+        row = model(**doc)
+        if fmt == "csv":
+            values = row.model_dump(mode="json")
+            chunk.append(csv_line([csv_value(values[column]) for column in columns]))
+        else:
+            chunk.append(row.model_dump_json() + "\n")
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+def export_response(name: str, cursor, model, fmt: str) -> StreamingResponse:
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    filename = f"{name}-{datetime.now(timezone.utc):%Y%m%d}.{fmt}"
+    return StreamingResponse(
+        export_rows(cursor, model, fmt),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@api_router.get("/export/events")
+async def export_events(
+    status: Optional[str] = None,
+    institution_id: Optional[str] = None,
+    priority: Optional[str] = None,
+    fmt: str = Query("csv", alias="format"),
+    current_user: dict = Depends(get_current_user)
+):
+    """All events matching the /events filters, newest first, as CSV or NDJSON"""
+    cursor = db.events.aggregate([
+        {"$match": event_list_query(status, institution_id, priority)},
+        {"$sort": dict(keyset_sort("event_date_start", -1))},
+    ] + EVENT_ENRICHMENT_STAGES, batchSize=EXPORT_CHUNK_ROWS)
+    return export_response("events", cursor, EventResponse, fmt)
+
+@api_router.get("/export/tasks")
+async def export_tasks(
+    status: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    event_id: Optional[str] = None,
+    fmt: str = Query("csv", alias="format"),
+    current_user: dict = Depends(get_current_user)
+):
+    """All tasks matching the /tasks filters, by due date, as CSV or NDJSON"""
+    cursor = db.tasks.aggregate([
+        {"$match": task_list_query(status, assigned_to, event_id, current_user)},
+        {"$sort": dict(keyset_sort("due_date", 1))},
+    ] + TASK_ENRICHMENT_STAGES, batchSize=EXPORT_CHUNK_ROWS)
+    return export_response("tasks", cursor, TaskResponse, fmt)
+
+@api_router.get("/export/deliveries")
+async def export_deliveries(
+    institution_id: Optional[str] = None,
+    task_type: Optional[str] = None,
+    fmt: str = Query("csv", alias="format"),
+    current_user: dict = Depends(get_current_user)
+):
+    """All public deliveries matching the /deliveries/public filters, newest first"""
+    cursor = db.public_deliveries.find(
+        delivery_list_query(institution_id, task_type), {"_id": 0}
+    ).sort(keyset_sort("completed_at", -1)).batch_size(EXPORT_CHUNK_ROWS)
+    return export_response("deliveries", cursor, DeliverablePublic, fmt)
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_KINDS = ["events", "tasks"]
+IMPORT_ROLES = ["admin", "media_head"]
+
+def clean_csv_row(row: dict) -> dict:
+    """Drop blank cells so they fall back to the model defaults"""
+    return {
+        key.strip(): value.strip()
+        for key, value in row.items()
+        if key and isinstance(value, str) and value.strip()
+    }
+
+def validation_message(e: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors())
+
+def event_from_row(row: dict, institutions: dict) -> EventCreate:
+    # Spreadsheets name the institution; an export's institution_id also works
+    name = row.pop("institution_name", None) or row.pop("institution", None)
+    if "institution_id" in row:
+        if row["institution_id"] not in institutions.values():
+            raise ValueError(f"Unknown institution_id: {row['institution_id']}")
+    elif not name:
+        raise ValueError("institution_name is required")
+    elif name.lower() not in institutions:
+        raise ValueError(f"Unknown institution: {name}")
+    else:
+        row["institution_id"] = institutions[name.lower()]
+    if "requirements" in row:
+        row["requirements"] = [item.strip() for item in row["requirements"].split(";") if item.strip()]
+    return EventCreate(**row)
+
+def task_from_row(row: dict, users: dict) -> TaskCreate:
+    # assigned_to may be a user id or an email address
+    assignee = row.get("assigned_to") or row.pop("assigned_to_email", None)
+    if not assignee:
+        raise ValueError("assigned_to is required")
+    if assignee.lower() not in users:
+        raise ValueError(f"Unknown user: {assignee}")
+    row["assigned_to"] = users[assignee.lower()]
+    return TaskCreate(**row)
+
+async def write_import_batch(kind: str, batch: List[tuple], current_user: dict, errors: List[ImportRowError]) -> int:
+    """Insert one batch of (line, model) pairs and return how many were stored"""
+    events = {}
+    if kind == "tasks":
+        events = await fetch_by_ids(db.events, (model.event_id for _, model in batch), ["title"])
     
-    deliverables = []
-    for task in tasks:
-        event = await db.events.find_one({"id": task["event_id"]}, {"_id": 0})
-        if not event:
-            continue
-        
-        # Apply filters
-        if institution_id and event["institution_id"] != institution_id:
-            continue
-        if task_type and task["type"] != task_type:
+    now = datetime.now(timezone.utc)
+    lines = []
+    docs = []
+    for line, model in batch:
+        if kind == "tasks" and model.event_id not in events:
+            errors.append(ImportRowError(row=line, error=f"Unknown event_id: {model.event_id}"))
             continue
-        
-        inst = await db.institutions.find_one({"id": event["institution_id"]}, {"_id": 0})
-        
-        deliverables.append({
-            "id": task["id"],
-            "event_id": task["event_id"],
-            "event_title": event["title"],
-            "institution_name": inst["name"] if inst else "Unknown",
-            "event_date": datetime.fromisoformat(event["event_date_start"]) if isinstance(event.get('event_date_start'), str) else event.get('event_date_start'),
-            "task_type": task["type"],
-            "deliverable_link": task["deliverable_link"],
-            "priority": event.get("priority", "normal"),
-            "completed_at": datetime.fromisoformat(task["created_at"]) if isinstance(task.get('created_at'), str) else task.get('created_at', datetime.now(timezone.utc))
-        })
-    
-    # Sort by completed date
-    deliverables.sort(key=lambda x: x["completed_at"], reverse=True)
-    
-    return deliverables
+        doc = model.model_dump()
+        doc["id"] = str(uuid.uuid4())
+        if kind == "events":
+            doc["created_by"] = current_user["id"]
+        doc["created_at"] = now
+        doc["updated_at"] = now
+        lines.append(line)
+        docs.append(doc)
+    if not docs:
+        return 0
+    
+    try:
+        await db[kind].insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        failed = {err["index"]: err["errmsg"] for err in e.details["writeErrors"]}
+        errors.extend(ImportRowError(row=lines[index], error=message) for index, message in failed.items())
+        docs = [doc for index, doc in enumerate(docs) if index not in failed]
+    if not docs:
+        return 0
+    
+    # Side effects are batched the same way as in POST /tasks/bulk
+    if kind == "events":
+        await public_cache.invalidate("events")
+        await broadcast_batch_change("event", "created", [doc["id"] for doc in docs])
+        return len(docs)
+    
+    await upsert_public_deliveries([doc for doc in docs if doc["status"] == "completed"])
+    await notification_outbox.enqueue_many([
+        build_notification(
+            user_id=doc["assigned_to"],
+            title="New Task Assigned",
+            message=f"You have been assigned a {doc['type']} task for {events[doc['event_id']]['title']}",
+            notif_type="task_assigned",
+            related_id=doc["id"]
+        )
+        for doc in docs
+    ])
+    for doc in docs:
+        await broadcast_change("task", "created", doc["id"], Task(**doc).model_dump(), audience=[doc["assigned_to"]])
+    return len(docs)
+
+async def import_csv(kind: str, lines, current_user: dict, batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Validate and store rows read lazily from an iterable of CSV lines.
+
+    Institutions and users are small, so each is loaded into one lookup map
+    up front; events referenced by task rows are checked once per batch.
+    Batches are stored as they fill up, so if the file stops decoding part
+    way through, the rows before that point are kept and the report says
+    where reading stopped.
+    """
+    if kind not in IMPORT_KINDS:
+        raise HTTPException(status_code=400, detail=f"kind must be one of: {', '.join(IMPORT_KINDS)}")
+    
+    lookup = {}
+    if kind == "events":
+        async for inst in db.institutions.find({}, {"_id": 0, "id": 1, "name": 1}):
+            lookup[inst["name"].lower()] = inst["id"]
+    else:
+        async for user in db.users.find({}, {"_id": 0, "id": 1, "email": 1}):
+            lookup[user["id"]] = user["id"]
+            lookup[user["email"].lower()] = user["id"]
+    
+    errors = []
+    batch = []
+    total = 0
+    imported = 0
+    reader = csv.DictReader(lines)
+    try:
+        for row in reader:
+            total += 1
+            line = reader.line_num
+            try:
+                if kind == "events":
+                    batch.append((line, event_from_row(clean_csv_row(row), lookup)))
+                else:
+                    batch.append((line, task_from_row(clean_csv_row(row), lookup)))
+            except ValidationError as e:
+                errors.append(ImportRowError(row=line, error=validation_message(e)))
+            except ValueError as e:
+                errors.append(ImportRowError(row=line, error=str(e)))
+            if len(batch) >= batch_size:
+                imported += await write_import_batch(kind, batch, current_user, errors)
+                batch = []
+    except UnicodeDecodeError:
+        # Earlier batches are already stored, so report them and where reading stopped
+        errors.append(ImportRowError(
+            row=reader.line_num + 1,
+            error="Not valid UTF-8 here or further on; this line and the rest of the file were not imported"
+        ))
+    if batch:
+        imported += await write_import_batch(kind, batch, current_user, errors)
+    
+    errors.sort(key=lambda err: err.row)
+    return ImportReport(kind=kind, total_rows=total, imported=imported, errors=errors)
+
+@api_router.post("/import/{kind}", response_model=ImportReport)
+async def import_upload(
+    kind: str,
+    file: UploadFile = File(...),
+    current_user: dict = Depends(require_role(IMPORT_ROLES))
+):
+    """Import events or tasks from a CSV upload; rows with errors are skipped and reported.
+
+    Event rows name their institution in an institution_name column and may
+    list requirements separated by ";". Task rows may give assigned_to as an
+    email address.
+    """
+    # Starlette spools large uploads to disk, so rows are read from there line by line
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return await import_csv(kind, lines, current_user)
+    finally:
+        lines.detach()
 
 # ============================================================================
 # DASHBOARD STATS
 # ============================================================================
 
-@api_router.get("/dashboard/stats", response_model=DashboardStats)
-async def get_dashboard_stats(current_user: dict = Depends(require_role(["admin", "media_head"]))):
+# Shared snapshot so concurrent dashboard loads reuse one set of counts
+DASHBOARD_CACHE_TTL_SECONDS = float(os.environ.get('DASHBOARD_CACHE_TTL_SECONDS', '15'))
+dashboard_snapshot = {"stats": None, "expires_at": 0.0}
+
+def facet_counts(result: List[dict]) -> dict:
+    """Flatten a $facet of {name: [..., {"$count": "count"}]} into {name: count}"""
+    facets = result[0] if result else {}
+    return {name: rows[0]["count"] if rows else 0 for name, rows in facets.items()}
+
+async def compute_dashboard_stats() -> DashboardStats:
     now = datetime.now(timezone.utc)
-    
-    # Upcoming events (future from today)
-    upcoming_events = await db.events.count_documents({
-        "event_date_start": {"$gte": now.isoformat()}
-    })
-    
-    # Pending deliveries (tasks not completed OR events not closed)
-    pending_tasks = await db.tasks.count_documents({"status": {"$ne": "completed"}})
-    pending_events = await db.events.count_documents({"status": {"$ne": "closed"}})
-    pending_deliveries = pending_tasks + pending_events
-    
-    # Events closed this month
     start_of_month = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
-    closed_this_month = await db.events.count_documents({
-        "status": "closed",
-        "created_at": {"$gte": start_of_month.isoformat()}
-    })
-    
-    # Overdue tasks
-    overdue_query = {
-        "status": {"$ne": "completed"},
-        "due_date": {"$ne": None, "$lt": now.isoformat()}
-    }
-    overdue_tasks = await db.tasks.count_documents(overdue_query)
     
-    # Total counts
-    total_events = await db.events.count_documents({})
-    total_tasks = await db.tasks.count_documents({})
+    # One pass over each collection, both collections in parallel
+    event_result, task_result = await asyncio.gather(
+        db.events.aggregate([{"$facet": {
+            # Upcoming events (future from today)
+            "upcoming": [{"$match": {"event_date_start": {"$gte": now}}}, {"$count": "count"}],
+            "pending": [{"$match": {"status": {"$ne": "closed"}}}, {"$count": "count"}],
+            # Events closed this month
+            "closed_this_month": [
+                {"$match": {"status": "closed", "created_at": {"$gte": start_of_month}}},
+                {"$count": "count"}
+            ],
+            "total": [{"$count": "count"}]
+        }}]).to_list(1),
+        db.tasks.aggregate([{"$facet": {
+            "pending": [{"$match": {"status": {"$ne": "completed"}}}, {"$count": "count"}],
+            "overdue": [
+                {"$match": {"status": {"$ne": "completed"}, "due_date": {"$ne": None, "$lt": now}}},
+                {"$count": "count"}
+            ],
+            "total": [{"$count": "count"}]
+        }}]).to_list(1)
+    )
+    events = facet_counts(event_result)
+    tasks = facet_counts(task_result)
     
     return DashboardStats(
-        upcoming_events=upcoming_events,
-        pending_deliveries=pending_deliveries,
-        closed_this_month=closed_this_month,
-        overdue_tasks=overdue_tasks,
-        total_events=total_events,
-        total_tasks=total_tasks
+        upcoming_events=events["upcoming"],
+        # Pending deliveries (tasks not completed OR events not closed)
+        pending_deliveries=tasks["pending"] + events["pending"],
+        closed_this_month=events["closed_this_month"],
+        overdue_tasks=tasks["overdue"],
+        total_events=events["total"],
+        total_tasks=tasks["total"]
     )
 
+async def refresh_dashboard_snapshot() -> DashboardStats:
+    dashboard_snapshot["stats"] = await compute_dashboard_stats()
+    dashboard_snapshot["expires_at"] = time.monotonic() + DASHBOARD_CACHE_TTL_SECONDS
+    return dashboard_snapshot["stats"]
+
+@api_router.get("/dashboard/stats", response_model=DashboardStats)
+async def get_dashboard_stats(request: Request, current_user: dict = Depends(require_role(["admin", "media_head"]))):
+    if dashboard_snapshot["expires_at"] > time.monotonic():
+        return dashboard_snapshot["stats"]
+    # Requests arriving while the snapshot is refreshed wait for that refresh
+    return await single_flight.run(request.scope["route"].path, ("dashboard_stats",), refresh_dashboard_snapshot)
+
 # ============================================================================
 # DELETE ENDPOINTS
 # ============================================================================
@@ -945,6 +2268,8 @@ async def delete_event(event_id: str, current_user: dict = Depends(require_role(
     event = await db.events.find_one({"id": event_id})
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
+    task_ids = await db.tasks.distinct("id", {"event_id": event_id})
+    allocation_ids = await db.equipment_allocations.distinct("id", {"event_id": event_id})
     
     # Delete all associated tasks
     await db.tasks.delete_many({"event_id": event_id})
@@ -954,6 +2279,15 @@ async def delete_event(event_id: str, current_user: dict = Depends(require_role(
     
     # Delete the event
     await db.events.delete_one({"id": event_id})
+    await db.public_deliveries.delete_many({"event_id": event_id})
+    await public_cache.invalidate("events", "deliveries")
+    await record_deletions("events", [event_id])
+    await record_deletions("tasks", task_ids)
+    await record_deletions("equipment_allocations", allocation_ids)
+    allocation_index.invalidate()
+    
+    # Clients drop the event's tasks and allocations along with it
+    await broadcast_change("event", "deleted", event_id)
     
     return {"message": "Event and associated data deleted successfully"}
 
@@ -965,6 +2299,11 @@ async def delete_task(task_id: str, current_user: dict = Depends(require_role(["
         raise HTTPException(status_code=404, detail="Task not found")
     
     await db.tasks.delete_one({"id": task_id})
+    result = await db.public_deliveries.delete_one({"id": task_id})
+    if result.deleted_count:
+        await public_cache.invalidate("deliveries")
+    await record_deletions("tasks", [task_id])
+    await broadcast_change("task", "deleted", task_id, audience=[task["assigned_to"]])
     return {"message": "Task deleted successfully"}
 
 @api_router.delete("/institutions/{institution_id}")
@@ -983,6 +2322,8 @@ async def delete_institution(institution_id: str, current_user: dict = Depends(r
         raise HTTPException(status_code=404, detail="Institution not found")
     
     await db.institutions.delete_one({"id": institution_id})
+    await public_cache.invalidate("institutions")
+    await broadcast_change("institution", "deleted", institution_id)
     return {"message": "Institution deleted successfully"}
 
 @api_router.delete("/equipment/{equipment_id}")
@@ -1001,6 +2342,8 @@ async def delete_equipment(equipment_id: str, current_user: dict = Depends(requi
         raise HTTPException(status_code=404, detail="Equipment not found")
     
     await db.equipment.delete_one({"id": equipment_id})
+    await record_deletions("equipment", [equipment_id])
+    await broadcast_change("equipment", "deleted", equipment_id)
     return {"message": "Equipment deleted successfully"}
 
 @api_router.delete("/users/{user_id}")
@@ -1016,6 +2359,9 @@ async def delete_user(user_id: str, current_user: dict = Depends(require_role(["
     # Note: In production, you may want to reassign tasks instead of deleting the user
     # For now, we'll allow deletion
     await db.users.delete_one({"id": user_id})
+    token_versions.discard(user_id)
+    user_cache.evict(user_id)
+    await broadcast_change("user", "deleted", user_id)
     return {"message": "User deleted successfully"}
 
 # ============================================================================
@@ -1030,10 +2376,6 @@ async def get_notifications(current_user: dict = Depends(get_current_user)):
         {"_id": 0}
     ).sort("created_at", -1).to_list(100)
     
-    for notif in notifications:
-        if isinstance(notif.get('created_at'), str):
-            notif['created_at'] = datetime.fromisoformat(notif['created_at'])
-    
     return notifications
 
 @api_router.get("/notifications/unread-count")
@@ -1056,6 +2398,7 @@ async def mark_notification_read(notification_id: str, current_user: dict = Depe
         {"id": notification_id},
         {"$set": {"is_read": True}}
     )
+    await publish_unread_count(current_user["id"])
     return {"message": "Notification marked as read"}
 
 @api_router.put("/notifications/mark-all-read")
@@ -1065,11 +2408,11 @@ async def mark_all_read(current_user: dict = Depends(get_current_user)):
         {"user_id": current_user["id"], "is_read": False},
         {"$set": {"is_read": True}}
     )
+    await publish_unread_count(current_user["id"])
     return {"message": "All notifications marked as read"}
 
-async def create_notification(user_id: str, title: str, message: str, notif_type: str, related_id: str = None):
-    """Helper function to create notifications"""
-    notification = {
+def build_notification(user_id: str, title: str, message: str, notif_type: str, related_id: str = None) -> dict:
+    return {
         "id": str(uuid.uuid4()),
         "user_id": user_id,
         "title": title,
@@ -1077,9 +2420,781 @@ async def create_notification(user_id: str, title: str, message: str, notif_type
         "type": notif_type,
         "related_id": related_id,
         "is_read": False,
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
-    await db.notifications.insert_one(notification)
+
+async def create_notification(user_id: str, title: str, message: str, notif_type: str, related_id: str = None):
+    """Queue a notification; the outbox worker stores and pushes it"""
+    await notification_outbox.enqueue(build_notification(user_id, title, message, notif_type, related_id))
+
+# ============================================================================
+# NOTIFICATION OUTBOX
+# ============================================================================
+
+NOTIFICATION_OUTBOX_SIZE = int(os.environ.get('NOTIFICATION_OUTBOX_SIZE', '1000'))
+NOTIFICATION_BATCH_SIZE = int(os.environ.get('NOTIFICATION_BATCH_SIZE', '100'))
+NOTIFICATION_MAX_RETRIES = int(os.environ.get('NOTIFICATION_MAX_RETRIES', '5'))
+DUPLICATE_KEY_ERROR = 11000
+
+class NotificationOutbox:
+    """Buffers notifications so requests don't wait on the insert.
+
+    A single worker drains the queue with insert_many, retrying failed
+    batches with backoff. When the queue is full, enqueue waits for room,
+    which slows writers down instead of growing memory without bound.
+    Once closed, notifications are written directly instead of queued.
+    """
+
+    def __init__(self, max_size: int, batch_size: int, max_retries: int):
+        self.queue = asyncio.Queue(maxsize=max_size)
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.task = None
+        self.closed = False
+
+    def start(self):
+        if not self.closed and (self.task is None or self.task.done()):
+            self.task = asyncio.create_task(self.run())
+
+    async def enqueue(self, notification: dict):
+        await self.enqueue_many([notification])
+
+    async def enqueue_many(self, notifications: List[dict]):
+        if self.closed:
+            if notifications:
+                await self.deliver(notifications)
+            return
+        self.start()
+        for notification in notifications:
+            await self.queue.put(notification)
+
+    def take(self, limit: int) -> List[dict]:
+        batch = []
+        while len(batch) < limit and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def run(self):
+        # Started from a request; count its inserts as background work
+        current_query_stats.set(None)
+        while True:
+            batch = [await self.queue.get()]
+            batch += self.take(self.batch_size - 1)
+            await self.deliver_taken(batch)
+            # None is the stop signal put by close()
+            if None in batch:
+                return
+
+    async def deliver_taken(self, batch: List[Optional[dict]]):
+        notifications = [notification for notification in batch if notification is not None]
+        try:
+            if notifications:
+                await self.deliver(notifications)
+        except Exception as e:
+            logger.error(f"Notification delivery failed: {e}")
+        finally:
+            for _ in batch:
+                self.queue.task_done()
+
+    async def deliver(self, batch: List[dict]):
+        for attempt in range(self.max_retries + 1):
+            try:
+                await db.notifications.insert_many(batch, ordered=False)
+                break
+            except BulkWriteError as e:
+                # Documents stored by an earlier attempt come back as duplicates
+                if all(err["code"] == DUPLICATE_KEY_ERROR for err in e.details["writeErrors"]):
+                    break
+                error = e
+            except Exception as e:
+                error = e
+            if attempt == self.max_retries:
+                logger.error(f"Dropping {len(batch)} notification(s) after {attempt + 1} attempts: {error}")
+                return
+            await asyncio.sleep(min(2 ** attempt * 0.1, 5))
+        
+        for notification in batch:
+            if notification_broker.has_subscribers(notification["user_id"]):
+                notification_broker.publish(
+                    notification["user_id"],
+                    format_sse("notification", Notification(**notification).model_dump_json(), notification["id"]),
+                    notification["id"]
+                )
+        for user_id in {notification["user_id"] for notification in batch}:
+            await publish_unread_count(user_id)
+
+    async def flush(self):
+        """Wait until every notification queued so far has been stored"""
+        self.start()
+        await self.queue.join()
+
+    async def close(self):
+        """Let the worker store everything queued, including a batch in retry, then stop it"""
+        self.closed = True
+        if self.task and not self.task.done():
+            await self.queue.put(None)
+            await self.task
+        self.task = None
+        # Writers that were waiting for room when the worker stopped
+        while not self.queue.empty():
+            await self.deliver_taken(self.take(self.batch_size))
+
+notification_outbox = NotificationOutbox(NOTIFICATION_OUTBOX_SIZE, NOTIFICATION_BATCH_SIZE, NOTIFICATION_MAX_RETRIES)
+
+@app.on_event("startup")
+async def start_notification_outbox():
+    notification_outbox.closed = False
+    notification_outbox.start()
+
+# ============================================================================
+# NOTIFICATION STREAM
+# ============================================================================
+
+SSE_HEARTBEAT_SECONDS = float(os.environ.get('SSE_HEARTBEAT_SECONDS', '15'))
+SSE_RETRY_MILLISECONDS = 3000
+SSE_QUEUE_SIZE = 100
+
+def format_sse(event: str, data: str, event_id: Optional[str] = None) -> str:
+    message = f"event: {event}\ndata: {data}\n"
+    if event_id:
+        message = f"id: {event_id}\n" + message
+    return message + "\n"
+
+class NotificationBroker:
+    """Fans notification events out to the SSE streams open in this process"""
+
+    def __init__(self):
+        self.subscribers = {}
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+        self.subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue):
+        queues = self.subscribers.get(user_id)
+        if queues:
+            queues.discard(queue)
+            if not queues:
+                del self.subscribers[user_id]
+
+    def has_subscribers(self, user_id: str) -> bool:
+        return user_id in self.subscribers
+
+    def publish(self, user_id: str, message: str, event_id: Optional[str] = None):
+        for queue in self.subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait((event_id, message))
+            except asyncio.QueueFull:
+                # A stalled client catches up from Last-Event-ID when it reconnects
+                pass
+
+notification_broker = NotificationBroker()
+
+async def unread_count_event(user_id: str) -> str:
+    count = await db.notifications.count_documents({"user_id": user_id, "is_read": False})
+    return format_sse("unread-count", json.dumps({"count": count}))
+
+async def publish_unread_count(user_id: str):
+    if notification_broker.has_subscribers(user_id):
+        notification_broker.publish(user_id, await unread_count_event(user_id))
+
+async def get_stream_user(
+    token: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> dict:
+    if credentials:
+        token = credentials.credentials
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+
+async def notification_events(request: Request, user_id: str, last_event_id: Optional[str]):
+    # Subscribe before replaying so nothing created in between is lost
+    queue = notification_broker.subscribe(user_id)
+    try:
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n"
+        
+        replayed = set()
+        last_seen = await db.notifications.find_one(
+            {"id": last_event_id, "user_id": user_id}, {"_id": 0}
+        ) if last_event_id else None
+        if last_seen:
+            missed = await db.notifications.find(
+                {"user_id": user_id, "created_at": {"$gte": last_seen["created_at"]}, "id": {"$ne": last_event_id}},
+                {"_id": 0}
+            ).sort("created_at", 1).to_list(SSE_QUEUE_SIZE)
+            for notif in missed:
+                replayed.add(notif["id"])
+                yield format_sse("notification", Notification(**notif).model_dump_json(), notif["id"])
+        
+        yield await unread_count_event(user_id)
+        
+        while True:
+            try:
+                event_id, message = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": heartbeat\n\n"
+                continue
+            if event_id not in replayed:
+                yield message
+    finally:
+        notification_broker.unsubscribe(user_id, queue)
+
+@api_router.get("/notifications/stream")
+async def stream_notifications(request: Request, current_user: dict = Depends(get_stream_user)):
+    """Server-Sent Events: new notifications and unread-count changes for the current user"""
+    return StreamingResponse(
+        notification_events(request, current_user["id"], request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# ============================================================================
+# DELTA SYNC
+# ============================================================================
+
+# Collections served by /sync. Every write to them sets updated_at and every
+# delete leaves a tombstone, so a client holding a sync token can fetch just
+# what changed since it was issued.
+SYNC_COLLECTIONS = ["events", "tasks", "equipment", "equipment_allocations"]
+SYNC_TOMBSTONE_TTL_DAYS = int(os.environ.get('SYNC_TOMBSTONE_TTL_DAYS', '30'))
+# Tokens point slightly into the past so a write stamped just before a sync
+# but committed just after it is still picked up by the next one
+SYNC_CLOCK_SKEW = timedelta(seconds=5)
+
+def encode_sync_token(moment: datetime) -> str:
+    return base64.urlsafe_b64encode(json_util.dumps(moment).encode('utf-8')).decode('ascii')
+
+def decode_sync_token(token: str) -> datetime:
+    try:
+        moment = json_util.loads(base64.urlsafe_b64decode(token.encode('ascii')), json_options=CURSOR_JSON_OPTIONS)
+    except (ValueError, TypeError):
+        moment = None
+    if not isinstance(moment, datetime):
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+    return moment
+
+async def record_deletions(collection_name: str, ids: List[str], user_id: Optional[str] = None):
+    """Leave tombstones for /sync; with user_id, the documents only left that user's view"""
+    if ids:
+        deleted_at = datetime.now(timezone.utc)
+        await db.tombstones.insert_many([
+            {"collection": collection_name, "id": doc_id, "deleted_at": deleted_at, "user_id": user_id}
+            for doc_id in ids
+        ])
+
+@api_router.get("/sync", response_model=SyncResponse)
+async def sync_changes(since: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    """Documents created, updated or deleted since the token.
+
+    Without a token only a starting token is returned: fetch it before the
+    initial full load, then pass the latest next_token on each refresh.
+    """
+    now = datetime.now(timezone.utc)
+    result = {name: [] for name in SYNC_COLLECTIONS}
+    result["deleted"] = {name: [] for name in SYNC_COLLECTIONS}
+    if not since:
+        return SyncResponse(**result, next_token=encode_sync_token(now - SYNC_CLOCK_SKEW))
+
+    since_at = decode_sync_token(since)
+    if since_at < now - timedelta(days=SYNC_TOMBSTONE_TTL_DAYS):
+        # Tombstones this old have expired, so deletions could be missed
+        raise HTTPException(status_code=410, detail="Sync token expired, reload all data")
+
+    truncated_at = []
+    for name in SYNC_COLLECTIONS:
+        query = {"updated_at": {"$gte": since_at}}
+        # Team members can only see their own tasks
+        if name == "tasks" and current_user["role"] == "team_member":
+            query["assigned_to"] = current_user["id"]
+        docs = await db[name].find(query, {"_id": 0}).sort("updated_at", 1).to_list(PAGE_SIZE_LIMIT + 1)
+        if len(docs) > PAGE_SIZE_LIMIT:
+            docs = docs[:PAGE_SIZE_LIMIT]
+            truncated_at.append(docs[-1]["updated_at"])
+        result[name] = docs
+
+    # Team members also get the tasks reassigned away from them
+    scopes = [None, current_user["id"]] if current_user["role"] == "team_member" else [None]
+    tombstones = await db.tombstones.find(
+        {"deleted_at": {"$gte": since_at}, "user_id": {"$in": scopes}}, {"_id": 0, "collection": 1, "id": 1}
+    ).to_list(None)
+    returned = {name: {doc["id"] for doc in result[name]} for name in SYNC_COLLECTIONS}
+    for tombstone in tombstones:
+        # A document still returned above came back into view after it left
+        if tombstone["id"] not in returned.get(tombstone["collection"], ()):
+            result["deleted"].setdefault(tombstone["collection"], []).append(tombstone["id"])
+
+    if truncated_at:
+        # Resume from the earliest cut-off; documents at that instant are sent again
+        next_at = max(min(truncated_at), since_at + timedelta(milliseconds=1))
+        return SyncResponse(**result, next_token=encode_sync_token(next_at), has_more=True)
+    return SyncResponse(**result, next_token=encode_sync_token(now - SYNC_CLOCK_SKEW))
+
+# ============================================================================
+# LIVE UPDATES
+# ============================================================================
+
+# Writes broadcast compact change messages ({entity, op, id, fields}) so open
+# pages can patch their local state instead of re-fetching whole lists. Batch
+# writes send one {entity, op, ids} message and clients fetch those rows. The
+# hub is pluggable: CHANGE_HUB_BACKEND selects an entry of CHANGE_HUB_BACKENDS.
+CHANGE_HUB_BACKEND = os.environ.get('CHANGE_HUB_BACKEND', 'memory')
+CHANGE_QUEUE_SIZE = 256
+
+class ChangeSubscription:
+    def __init__(self):
+        self.queue = asyncio.Queue(maxsize=CHANGE_QUEUE_SIZE)
+        # Set when messages were dropped; the client must re-fetch
+        self.lagged = False
+
+class InMemoryChangeHub:
+    """Delivers changes to the WebSocket clients connected to this process"""
+
+    def __init__(self):
+        self.subscriptions = set()
+
+    def subscribe(self) -> ChangeSubscription:
+        subscription = ChangeSubscription()
+        self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription):
+        self.subscriptions.discard(subscription)
+
+    async def publish(self, change: dict, audience: Optional[List[str]] = None):
+        for subscription in self.subscriptions:
+            try:
+                subscription.queue.put_nowait((change, audience))
+            except asyncio.QueueFull:
+                subscription.lagged = True
+
+CHANGE_HUB_BACKENDS = {
+    "memory": InMemoryChangeHub,
+}
+
+change_hub = CHANGE_HUB_BACKENDS[CHANGE_HUB_BACKEND]()
+
+def changed_fields(before: dict, update: dict) -> dict:
+    return {k: v for k, v in update.items() if before.get(k) != v}
+
+async def broadcast_change(
+    entity: str,
+    op: str,
+    entity_id: str,
+    fields: Optional[dict] = None,
+    audience: Optional[List[str]] = None
+):
+    """Publish a change; audience limits task changes for team members to these user ids"""
+    await change_hub.publish(
+        {"entity": entity, "op": op, "id": entity_id, "fields": jsonable_encoder(fields or {})},
+        audience
+    )
+
+async def broadcast_batch_change(entity: str, op: str, entity_ids: List[str]):
+    """Publish one change for many rows written together, e.g. an import batch"""
+    await change_hub.publish({"entity": entity, "op": op, "ids": entity_ids}, None)
+
+@api_router.websocket("/ws/changes")
+async def websocket_changes(websocket: WebSocket, token: Optional[str] = None):
+    """Live change feed; authenticate with ?token= like the notification stream"""
+    try:
+        user = await get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token or ""))
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await websocket.accept()
+    subscription = change_hub.subscribe()
+    # Clients never send anything, so a finished receive means they went away
+    disconnected = asyncio.create_task(websocket.receive())
+    try:
+        while True:
+            next_change = asyncio.create_task(subscription.queue.get())
+            done, _ = await asyncio.wait({next_change, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                next_change.cancel()
+                break
+            
+            if subscription.lagged:
+                subscription.lagged = False
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                await websocket.send_json({"op": "resync"})
+                continue
+            
+            change, audience = next_change.result()
+            if user["role"] == "team_member" and audience is not None and user["id"] not in audience:
+                continue
+            await websocket.send_json(change)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        change_hub.unsubscribe(subscription)
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def metric_labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + "}"
+
+class RequestMetrics:
+    """Per-route request latency and Mongo usage, rendered in Prometheus text format"""
+
+    def __init__(self):
+        self.requests = {}  # (method, route, status) -> count
+        self.latency = {}  # (method, route) -> [bucket counts..., sum, count]
+        self.queries = {}  # (method, route, command) -> count
+        self.query_seconds = {}  # (method, route) -> seconds
+        self.documents = {}  # (method, route) -> documents returned
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, stats: QueryStats):
+        key = (method, route)
+        self.requests[key + (status_code,)] = self.requests.get(key + (status_code,), 0) + 1
+        latency = self.latency.setdefault(key, [0] * len(LATENCY_BUCKETS) + [0.0, 0])
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                latency[i] += 1
+        latency[-2] += seconds
+        latency[-1] += 1
+        self.add_queries(key, stats)
+
+    def add_queries(self, key: tuple, stats: QueryStats):
+        with stats.lock:
+            for command, count in stats.commands.items():
+                self.queries[key + (command,)] = self.queries.get(key + (command,), 0) + count
+            self.query_seconds[key] = self.query_seconds.get(key, 0.0) + stats.seconds
+            self.documents[key] = self.documents.get(key, 0) + stats.documents
+
+    def render(self) -> str:
+        # Fold in background commands so far, then start counting them afresh
+        global background_query_stats
+        stats, background_query_stats = background_query_stats, QueryStats()
+        self.add_queries(("", "background"), stats)
+        
+        lines = [
+            "# HELP http_requests_total Requests served, by route template and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status_code), count in sorted(self.requests.items()):
+            lines.append(f"http_requests_total{metric_labels(method=method, route=route, status=status_code)} {count}")
+        lines += [
+            "# HELP http_request_duration_seconds Time to serve a request, by route template.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), latency in sorted(self.latency.items()):
+            for bound, count in zip(LATENCY_BUCKETS, latency):
+                lines.append(f"http_request_duration_seconds_bucket{metric_labels(method=method, route=route, le=bound)} {count}")
+            lines.append(f"http_request_duration_seconds_bucket{metric_labels(method=method, route=route, le='+Inf')} {latency[-1]}")
+            lines.append(f"http_request_duration_seconds_sum{metric_labels(method=method, route=route)} {latency[-2]:.6f}")
+            lines.append(f"http_request_duration_seconds_count{metric_labels(method=method, route=route)} {latency[-1]}")
+        lines += [
+            "# HELP mongo_queries_total Mongo commands issued, by route template and command.",
+            "# TYPE mongo_queries_total counter",
+        ]
+        for (method, route, command), count in sorted(self.queries.items()):
+            lines.append(f"mongo_queries_total{metric_labels(method=method, route=route, command=command)} {count}")
+        lines += [
+            "# HELP mongo_query_duration_seconds_total Time spent in Mongo commands, by route template.",
+            "# TYPE mongo_query_duration_seconds_total counter",
+        ]
+        for (method, route), seconds in sorted(self.query_seconds.items()):
+            lines.append(f"mongo_query_duration_seconds_total{metric_labels(method=method, route=route)} {seconds:.6f}")
+        lines += [
+            "# HELP mongo_documents_returned_total Documents returned by Mongo cursors, by route template.",
+            "# TYPE mongo_documents_returned_total counter",
+        ]
+        for (method, route), count in sorted(self.documents.items()):
+            lines.append(f"mongo_documents_returned_total{metric_labels(method=method, route=route)} {count}")
+        return "\n".join(lines) + "\n"
+
+request_metrics = RequestMetrics()
+
+def server_timing(seconds: float, stats: QueryStats) -> str:
+    return (
+        f'app;dur={seconds * 1000:.1f}, '
+        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.queries} queries, {stats.documents} docs"'
+    )
+
+class MetricsMiddleware:
+    """Times each HTTP request, counts its Mongo commands and adds a Server-Timing header"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = QueryStats(scope)
+        token = current_query_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+        
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", server_timing(time.perf_counter() - start, stats))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            request_metrics.observe(scope["method"], stats.route, status_code, time.perf_counter() - start, stats)
+
+@api_router.get("/metrics")
+async def get_metrics(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)):
+    """Prometheus scrape endpoint, authenticated with METRICS_TOKEN as a bearer token"""
+    # Route timings and cache stats are not for anonymous callers, so no token means no endpoint
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not (credentials and hmac.compare_digest(credentials.credentials, METRICS_TOKEN)):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return Response(request_metrics.render() + public_cache.render() + single_flight.render(), media_type="text/plain; version=0.0.4")
+
+# ============================================================================
+# SLOW QUERY LOG
+# ============================================================================
+
+# Opt-in: commands slower than SLOW_QUERY_MS are logged with the route that
+# issued them and their explain() plan, to a capped collection or, when
+# SLOW_QUERY_LOG_FILE is set, a rotating file of JSON lines.
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', '0'))
+SLOW_QUERY_LOG_FILE = os.environ.get('SLOW_QUERY_LOG_FILE')
+SLOW_QUERY_COLLECTION = "slow_queries"
+SLOW_QUERY_COLLECTION_BYTES = 16 * 1024 * 1024
+EXPLAINABLE_COMMANDS = {"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"}
+# Session and transport fields that explain does not accept
+COMMAND_ENVELOPE_FIELDS = {
+    "lsid", "$db", "$clusterTime", "$readPreference", "txnNumber", "autocommit",
+    "startTransaction", "writeConcern", "readConcern", "apiVersion", "apiStrict", "apiDeprecationErrors",
+}
+
+def query_shape(value):
+    """Keep the fields and operators of a filter but not the values it matches"""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [query_shape(item) for item in value]
+    return "?"
+
+def describe_command(command_name: str, command: dict) -> dict:
+    if command_name == "aggregate":
+        pipeline = [
+            {"$match": query_shape(stage["$match"])} if "$match" in stage else stage
+            for stage in command.get("pipeline", [])
+        ]
+        return {"pipeline": pipeline}
+    if command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes") or [{}]
+        return {"filter": query_shape(statements[0].get("q", {}))}
+    return {
+        "filter": query_shape(command.get("filter", command.get("query", {}))),
+        "sort": command.get("sort"),
+        "projection": command.get("projection", command.get("fields")),
+    }
+
+def winning_plan_stages(explain: dict) -> List[str]:
+    """Stage names of every winning plan in an explain result, including aggregation sub-plans"""
+    stages = []
+    
+    def walk(node, in_plan):
+        if isinstance(node, dict):
+            if in_plan and "stage" in node:
+                stages.append(node["stage"])
+            for key, value in node.items():
+                walk(value, in_plan or key == "winningPlan")
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, in_plan)
+    
+    walk(explain, False)
+    return stages
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: float, log_file: Optional[str]):
+        self.threshold_ms = threshold_ms
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.loop = None
+        self.file_logger = None
+        if threshold_ms and log_file:
+            self.file_logger = logging.getLogger("slow_queries")
+            self.file_logger.propagate = False
+            self.file_logger.addHandler(RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5))
+            self.file_logger.setLevel(logging.INFO)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def started(self, event, route: str):
+        # explain() and the log's own inserts would otherwise log themselves
+        if event.command_name == "explain" or event.command.get(event.command_name) == SLOW_QUERY_COLLECTION:
+            return
+        with self.lock:
+            self.pending[(event.connection_id, event.request_id)] = (dict(event.command), route)
+
+    def finished(self, event):
+        with self.lock:
+            pending = self.pending.pop((event.connection_id, event.request_id), None)
+        duration_ms = event.duration_micros / 1000
+        if pending is None or duration_ms < self.threshold_ms or self.loop is None:
+            return
+        command, route = pending
+        # Listener callbacks run on Motor's threads; explain and write from the event loop
+        self.loop.call_soon_threadsafe(
+            lambda: asyncio.ensure_future(self.record(event, command, route, duration_ms)),
+            context=contextvars.Context()
+        )
+
+    async def record(self, event, command: dict, route: str, duration_ms: float):
+        entry = {
+            "at": datetime.now(timezone.utc),
+            "route": route,
+            "command": event.command_name,
+            "collection": command.get(event.command_name),
+            "duration_ms": round(duration_ms, 1),
+            **describe_command(event.command_name, command),
+        }
+        if event.command_name in EXPLAINABLE_COMMANDS:
+            explain_command = {key: value for key, value in command.items() if key not in COMMAND_ENVELOPE_FIELDS}
+            try:
+                explain = await client[event.database_name].command(
+                    {"explain": explain_command, "verbosity": "queryPlanner"}
+                )
+                stages = winning_plan_stages(explain)
+                entry["plan"] = " <- ".join(stages)
+                entry["collscan"] = "COLLSCAN" in stages
+            except Exception as e:
+                entry["plan_error"] = str(e)
+        
+        try:
+            if self.file_logger:
+                self.file_logger.info(json_util.dumps(entry, json_options=CURSOR_JSON_OPTIONS))
+            else:
+                await db[SLOW_QUERY_COLLECTION].insert_one(entry)
+        except Exception as e:
+            logger.warning(f"Could not record slow query: {e}")
+
+slow_query_log = SlowQueryLog(SLOW_QUERY_MS, SLOW_QUERY_LOG_FILE)
+
+@app.on_event("startup")
+async def start_slow_query_log():
+    if not slow_query_log.enabled:
+        return
+    slow_query_log.loop = asyncio.get_running_loop()
+    if not slow_query_log.file_logger:
+        try:
+            await db.create_collection(SLOW_QUERY_COLLECTION, capped=True, size=SLOW_QUERY_COLLECTION_BYTES)
+        except CollectionInvalid:
+            pass  # already exists
+    logger.info(f"Logging Mongo commands slower than {SLOW_QUERY_MS:g} ms")
+
+# ============================================================================
+# INDEXES
+# ============================================================================
+
+# (keys, options) per collection, matching the query shapes used above
+INDEXES = {
+    "users": [
+        ("id", {"unique": True}),
+        ("email", {"unique": True}),
+        ("role", {}),
+        ([("created_at", 1), ("id", 1)], {}),
+    ],
+    "institutions": [
+        ("id", {"unique": True}),
+        ([("created_at", 1), ("id", 1)], {}),
+    ],
+    "events": [
+        ("id", {"unique": True}),
+        ([("institution_id", 1), ("status", 1), ("event_date_start", -1)], {}),
+        ([("status", 1), ("event_date_start", -1)], {}),
+        ([("event_date_start", -1), ("id", -1)], {}),
+        ([("event_date_end", 1), ("event_date_start", 1)], {}),
+        ("updated_at", {}),
+    ],
+    "tasks": [
+        ("id", {"unique": True}),
+        ([("assigned_to", 1), ("status", 1), ("due_date", 1)], {}),
+        ([("status", 1), ("due_date", 1)], {}),
+        ([("event_id", 1)], {}),
+        ([("due_date", 1), ("id", 1)], {}),
+        ("updated_at", {}),
+        ([("assigned_to", 1), ("updated_at", 1)], {}),
+    ],
+    "equipment": [
+        ("id", {"unique": True}),
+        ([("created_at", 1), ("id", 1)], {}),
+        ("updated_at", {}),
+    ],
+    "equipment_allocations": [
+        ("id", {"unique": True}),
+        ([("event_id", 1), ("created_at", 1), ("id", 1)], {}),
+        ([("created_at", 1), ("id", 1)], {}),
+        ("equipment_id", {}),
+        ([("equipment_id", 1), ("starts_at", 1), ("ends_at", 1)], {}),
+        ("updated_at", {}),
+    ],
+    "notifications": [
+        ("id", {"unique": True}),
+        ([("user_id", 1), ("is_read", 1), ("created_at", -1)], {}),
+    ],
+    "tombstones": [
+        # Expires tombstones once no accepted sync token can still need them
+        ("deleted_at", {"expireAfterSeconds": SYNC_TOMBSTONE_TTL_DAYS * 86400}),
+    ],
+    "public_deliveries": [
+        ("id", {"unique": True}),
+        ([("institution_id", 1), ("task_type", 1), ("completed_at", -1)], {}),
+        ([("task_type", 1), ("completed_at", -1)], {}),
+        ([("completed_at", -1), ("id", -1)], {}),
+        ("event_id", {}),
+    ],
+}
+
+async def ensure_indexes() -> List[str]:
+    """Create any missing index from INDEXES and return the names of the new ones.
+
+    create_index is a no-op for an index that already exists, so this is safe
+    to run on every startup.
+    """
+    created = []
+    for collection_name, specs in INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        for keys, options in specs:
+            try:
+                name = await collection.create_index(keys, **options)
+            except OperationFailure as e:
+                # Typically duplicate ids/emails in existing data; keep serving
+                logger.error(f"Could not create index {keys} on {collection_name}: {e}")
+                continue
+            if name not in existing:
+                created.append(f"{collection_name}.{name}")
+    return created
+
+@app.on_event("startup")
+async def create_indexes():
+    created = await ensure_indexes()
+    if created:
+        logger.info(f"Created {len(created)} index(es): {', '.join(created)}")
+    else:
+        logger.info("All indexes already exist")
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -1092,7 +3207,9 @@ app.add_middleware(
     allow_origins=[origin.strip() for origin in allowed_origins],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "Server-Timing"],
 )
+app.add_middleware(MetricsMiddleware)
 
 # Configure logging
 logging.basicConfig(
@@ -1103,4 +3220,6 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    # Store queued notifications while the connection is still open
+    await notification_outbox.close()
     client.close()
@@ -24,14 +24,52 @@ const NotificationBell = () => {
   useEffect(() => {
     if (user) {
       fetchNotifications();
-      fetchUnreadCount();
-      
-      // Poll for new notifications every 30 seconds
-      const interval = setInterval(() => {
+
+      if (typeof EventSource === 'undefined') {
+        // Fall back to polling for browsers without Server-Sent Events
         fetchUnreadCount();
-      }, 30000);
-      
-      return () => clearInterval(interval);
+        const interval = setInterval(() => {
+          fetchUnreadCount();
+        }, 30000);
+        return () => clearInterval(interval);
+      }
+
+      // The stream sends the unread count on connect and whenever it changes;
+      // EventSource reconnects on its own and resumes from the last event id
+      let source;
+      let retry;
+      const connect = () => {
+        const token = localStorage.getItem('token');
+        source = new EventSource(
+          `${api.defaults.baseURL}/notifications/stream?token=${encodeURIComponent(token)}`
+        );
+        source.addEventListener('notification', (event) => {
+          const notif = JSON.parse(event.data);
+          setNotifications((prev) => [notif, ...prev.filter((n) => n.id !== notif.id)].slice(0, 10));
+        });
+        source.addEventListener('unread-count', (event) => {
+          setUnreadCount(JSON.parse(event.data).count);
+        });
+        source.onerror = () => {
+          // A refused reconnect (e.g. 401 once the token was rotated or revoked)
+          // closes the stream for good, so open a new one with the current token,
+          // straight away if it changed and otherwise at the polling interval
+          if (source.readyState !== EventSource.CLOSED) return;
+          source.close();
+          const delay = localStorage.getItem('token') !== token ? 0 : 30000;
+          retry = setTimeout(() => {
+            // A new stream does not replay what was missed while disconnected
+            fetchNotifications();
+            connect();
+          }, delay);
+        };
+      };
+      connect();
+
+      return () => {
+        clearTimeout(retry);
+        source.close();
+      };
     }
   }, [user]);
 
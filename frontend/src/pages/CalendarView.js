@@ -13,21 +13,25 @@ import '../styles/calendar.css';
 const localizer = momentLocalizer(moment);
 
 const CalendarView = () => {
-  const [events, setEvents] = useState([]);
   const [calendarEvents, setCalendarEvents] = useState([]);
   const [loading, setLoading] = useState(true);
   const [selectedEvent, setSelectedEvent] = useState(null);
   const [currentDate, setCurrentDate] = useState(new Date());
 
   useEffect(() => {
-    fetchEvents();
-  }, []);
+    fetchEvents(currentDate);
+  }, [currentDate]);
 
-  const fetchEvents = async () => {
+  const fetchEvents = async (date) => {
     try {
-      const response = await api.get('/events');
+      // Load only the visible month, padded for the days shown from adjacent months
+      const response = await api.get('/events/range', {
+        params: {
+          start: moment(date).startOf('month').subtract(7, 'days').toISOString(),
+          end: moment(date).endOf('month').add(7, 'days').toISOString()
+        }
+      });
       const eventsData = response.data;
-      setEvents(eventsData);
 
       // Transform events for react-big-calendar
       const calEvents = eventsData.map((event) => ({
@@ -48,8 +52,15 @@ const CalendarView = () => {
     }
   };
 
-  const handleSelectEvent = (event) => {
+  const handleSelectEvent = async (event) => {
     setSelectedEvent(event.resource);
+    // Range results are compact; load the description for the details panel
+    try {
+      const response = await api.get(`/events/${event.id}`);
+      setSelectedEvent(response.data);
+    } catch (error) {
+      // Keep showing the compact details
+    }
   };
 
   const handleNavigate = (date) => {
@@ -140,30 +151,23 @@ const CalendarView = () => {
           <div className="lg:col-span-2">
             <Card>
               <CardContent className="p-6">
-                {calendarEvents.length === 0 ? (
-                  <div className="text-center py-20">
-                    <CalendarIcon className="w-16 h-16 text-slate-400 mx-auto mb-4" />
-                    <p className="text-slate-600 text-lg mb-2">No events scheduled</p>
-                    <p className="text-sm text-slate-500">Create events to see them on the calendar</p>
-                  </div>
-                ) : (
-                  <div style={{ height: '700px' }}>
-                    <Calendar
-                      localizer={localizer}
-                      events={calendarEvents}
-                      startAccessor="start"
-                      endAccessor="end"
-                      date={currentDate}
-                      onNavigate={handleNavigate}
-                      onSelectEvent={handleSelectEvent}
-                      eventPropGetter={eventStyleGetter}
-                      views={['month', 'week', 'day']}
-                      defaultView="month"
-                      popup
-                      selectable
-                    />
-                  </div>
-                )}
+                {/* Always rendered so empty months can still be navigated away from */}
+                <div style={{ height: '700px' }}>
+                  <Calendar
+                    localizer={localizer}
+                    events={calendarEvents}
+                    startAccessor="start"
+                    endAccessor="end"
+                    date={currentDate}
+                    onNavigate={handleNavigate}
+                    onSelectEvent={handleSelectEvent}
+                    eventPropGetter={eventStyleGetter}
+                    views={['month', 'week', 'day']}
+                    defaultView="month"
+                    popup
+                    selectable
+                  />
+                </div>
               </CardContent>
             </Card>
           </div>
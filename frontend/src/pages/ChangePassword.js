@@ -34,10 +34,12 @@ const ChangePassword = () => {
 
     try {
       setLoading(true);
-      await api.post('/auth/change-password', {
+      const response = await api.post('/auth/change-password', {
         old_password: oldPassword,
         new_password: newPassword
       });
+      // Changing the password revokes existing tokens; keep this session signed in
+      localStorage.setItem('token', response.data.token);
       toast.success('Password updated successfully');
       setOldPassword('');
       setNewPassword('');
@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import Layout from '../components/Layout';
-import api, { getStatusColor, getPriorityColor, formatDate } from '../utils/api';
+import api, { getAllPages, getStatusColor, getPriorityColor, formatDate } from '../utils/api';
 import { Card, CardHeader, CardTitle, CardDescription, CardContent } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
@@ -25,7 +25,7 @@ const Dashboard = () => {
     try {
       const [statsRes, eventsRes] = await Promise.all([
         api.get('/dashboard/stats'),
-        api.get('/events')
+        getAllPages('/events')
       ]);
       const sortedEvents = [...eventsRes.data].sort((a, b) => {
         const aDate = a.created_at ? new Date(a.created_at) : 0;
@@ -1,6 +1,6 @@
 import React, { useEffect, useMemo, useState } from 'react';
 import Layout from '../components/Layout';
-import api, { formatDate } from '../utils/api';
+import api, { getAllPages, formatDate } from '../utils/api';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Input } from '../components/ui/input';
@@ -49,7 +49,7 @@ const Employees = () => {
     setTasksLoading(true);
     try {
       const params = { assigned_to: employeeId };
-      const res = await api.get('/tasks', { params });
+      const res = await getAllPages('/tasks', { params });
       const data = res.data || [];
       setTasksRaw(data);
       setTasks(data);
@@ -3,7 +3,7 @@ import { useParams, useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
 import Layout from '../components/Layout';
 import ConfirmDialog from '../components/ConfirmDialog';
-import api, { getStatusColor, getPriorityColor, getTaskTypeColor, formatDate } from '../utils/api';
+import api, { getAllPages, getStatusColor, getPriorityColor, getTaskTypeColor, formatDate } from '../utils/api';
 import { Card, CardHeader, CardTitle, CardDescription, CardContent } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
@@ -56,10 +56,10 @@ const EventDetails = () => {
     try {
       const [eventRes, tasksRes, allocationsRes, membersRes, equipmentRes] = await Promise.all([
         api.get(`/events/${eventId}`),
-        api.get(`/tasks`, { params: { event_id: eventId } }),
-        api.get(`/equipment-allocations`, { params: { event_id: eventId } }),
+        getAllPages(`/tasks`, { params: { event_id: eventId } }),
+        getAllPages(`/equipment-allocations`, { params: { event_id: eventId } }),
         api.get(`/team-members`),  // Changed from /users to /team-members
-        api.get(`/equipment`)
+        getAllPages(`/equipment`)
       ]);
 
       setEvent(eventRes.data);
@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useLocation } from 'react-router-dom';
 import Layout from '../components/Layout';
 import ConfirmDialog from '../components/ConfirmDialog';
-import api, { getStatusColor, getPriorityColor, formatDate, formatDateTime } from '../utils/api';
+import api, { getAllPages, getStatusColor, getPriorityColor, formatDate, formatDateTime } from '../utils/api';
 import { Card, CardContent } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
@@ -62,14 +62,14 @@ const Events = () => {
   const fetchData = async () => {
     try {
       const [eventsRes, institutionsRes] = await Promise.all([
-        api.get('/events', {
+        getAllPages('/events', {
           params: {
             status: filters.status !== 'all' ? filters.status : undefined,
             institution_id: filters.institution !== 'all' ? filters.institution : undefined,
             priority: filters.priority !== 'all' ? filters.priority : undefined
           }
         }),
-        api.get('/institutions')
+        getAllPages('/institutions')
       ]);
       let eventsData = eventsRes.data;
 
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../components/Layout';
 import ConfirmDialog from '../components/ConfirmDialog';
-import api from '../utils/api';
+import api, { getAllPages } from '../utils/api';
 import { Card, CardContent } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
@@ -38,7 +38,7 @@ const Institutions = () => {
 
   const fetchInstitutions = async () => {
     try {
-      const response = await api.get('/institutions');
+      const response = await getAllPages('/institutions');
       setInstitutions(response.data);
     } catch (error) {
       toast.error('Failed to load institutions', {
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../components/Layout';
-import api, { getTaskTypeColor, formatDate } from '../utils/api';
+import { getAllPages, getTaskTypeColor, formatDate } from '../utils/api';
 import { Card, CardContent } from '../components/ui/card';
 import { Badge } from '../components/ui/badge';
 import { Calendar as CalendarIcon } from 'lucide-react';
@@ -25,7 +25,7 @@ const MyCalendar = () => {
 
   const fetchTasks = async () => {
     try {
-      const response = await api.get('/tasks');
+      const response = await getAllPages('/tasks');
       const tasksData = response.data;
       setTasks(tasksData);
 
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../components/Layout';
-import api, { getTaskTypeColor, formatDate, formatDateTime } from '../utils/api';
+import api, { getAllPages, getTaskTypeColor, formatDate, formatDateTime } from '../utils/api';
 import { Card, CardHeader, CardTitle, CardDescription, CardContent } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
@@ -30,7 +30,7 @@ const MyTasks = () => {
 
   const fetchTasks = async () => {
     try {
-      const response = await api.get('/tasks');
+      const response = await getAllPages('/tasks');
       setTasks(response.data);
     } catch (error) {
       toast.error('Failed to load tasks', {
@@ -4,7 +4,7 @@ import { Card, CardContent } from '../components/ui/card';
 import { Badge } from '../components/ui/badge';
 import { Select, SelectTrigger, SelectValue, SelectContent, SelectItem } from '../components/ui/select';
 import { Eye, ExternalLink } from 'lucide-react';
-import { formatDate, getTaskTypeColor, getPriorityColor } from '../utils/api';
+import { formatDate, getAllPages, getTaskTypeColor, getPriorityColor } from '../utils/api';
 
 const PublicDeliveries = () => {
   const [deliverables, setDeliverables] = useState([]);
@@ -20,8 +20,8 @@ const PublicDeliveries = () => {
   const fetchData = async () => {
     try {
       const [deliveriesRes, institutionsRes] = await Promise.all([
-        axios.get(`${process.env.REACT_APP_BACKEND_URL}/api/deliveries/public`),
-        axios.get(`${process.env.REACT_APP_BACKEND_URL}/api/institutions`)
+        getAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/deliveries/public`, {}, axios),
+        getAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/institutions`, {}, axios)
       ]);
       setDeliverables(deliveriesRes.data);
       setInstitutions(institutionsRes.data);
@@ -1,6 +1,6 @@
 import React, { useEffect, useMemo, useState } from "react";
 import axios from "axios";
-import { formatDate, getPriorityColor, getStatusColor, getTaskTypeColor } from "../utils/api";
+import { formatDate, getAllPages, getPriorityColor, getStatusColor, getTaskTypeColor } from "../utils/api";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "../components/ui/card";
 import { Badge } from "../components/ui/badge";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "../components/ui/select";
@@ -31,8 +31,8 @@ const PublicEvents = () => {
       try {
         const [eventsRes, instRes, deliveriesRes] = await Promise.all([
           axios.get(`${process.env.REACT_APP_BACKEND_URL}/api/events/public`),
-          axios.get(`${process.env.REACT_APP_BACKEND_URL}/api/institutions`),
-          axios.get(`${process.env.REACT_APP_BACKEND_URL}/api/deliveries/public`),
+          getAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/institutions`, {}, axios),
+          getAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/deliveries/public`, {}, axios),
         ]);
 
         setEvents(eventsRes.data);
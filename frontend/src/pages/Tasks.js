@@ -1,6 +1,6 @@
 import React, { useEffect, useMemo, useState } from 'react';
 import Layout from '../components/Layout';
-import api, { getStatusColor, formatDate } from '../utils/api';
+import api, { getAllPages, getStatusColor, formatDate } from '../utils/api';
 import { Card, CardHeader, CardTitle, CardDescription, CardContent } from '../components/ui/card';
 import { Badge } from '../components/ui/badge';
 import { Button } from '../components/ui/button';
@@ -54,7 +54,7 @@ const Tasks = () => {
   const fetchTasks = async () => {
     setListLoading(true);
     try {
-      const res = await api.get('/tasks');
+      const res = await getAllPages('/tasks');
       setTasks(res.data || []);
     } catch (error) {
       toast.error('Failed to load tasks', {
@@ -70,7 +70,7 @@ const Tasks = () => {
     try {
       const [membersRes, eventsRes] = await Promise.all([
         api.get('/team-members'),
-        api.get('/events')
+        getAllPages('/events')
       ]);
       setTeamMembers(membersRes.data || []);
       setAllEvents(eventsRes.data || []);
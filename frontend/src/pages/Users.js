@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../components/Layout';
 import ConfirmDialog from '../components/ConfirmDialog';
-import api from '../utils/api';
+import api, { getAllPages } from '../utils/api';
 import { Card, CardContent } from '../components/ui/card';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
@@ -39,7 +39,7 @@ const Users = () => {
 
   const fetchUsers = async () => {
     try {
-      const response = await api.get('/users');
+      const response = await getAllPages('/users');
       setUsers(response.data);
     } catch (error) {
       toast.error('Failed to load users', {
@@ -17,6 +17,19 @@ api.interceptors.request.use((config) => {
 
 export default api;
 
+// List endpoints return at most one page per request and send the cursor of
+// the next page in the X-Next-Cursor header; follow it to load every row.
+export const getAllPages = async (url, config = {}, client = api) => {
+  const data = [];
+  let cursor;
+  do {
+    const response = await client.get(url, { ...config, params: { ...config.params, cursor } });
+    data.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return { data };
+};
+
 // Helper functions
 export const getStatusColor = (status) => {
   const colors = {